@@ -3,26 +3,43 @@
 Generate software architecture diagrams from Python code with AI-powered insights.
 """
 
+from importlib import import_module
+
 __version__ = "0.1.0"
 __author__ = "Torstein Sørnes"
 
-from archgraph.analyzer import CodeAnalyzer
-from archgraph.exporters import DiagramExporter, StructurizrExporter
-from archgraph.generators import (
-    CallGraphGenerator,
-    ClassDiagramGenerator,
-    DependencyGraphGenerator,
-    PackageStructureGenerator,
-)
-from archgraph.llm_analyzer import LLMAnalyzer
-
-__all__ = [
-    "CodeAnalyzer",
-    "ClassDiagramGenerator",
-    "DependencyGraphGenerator",
-    "CallGraphGenerator",
-    "PackageStructureGenerator",
-    "DiagramExporter",
-    "StructurizrExporter",
-    "LLMAnalyzer",
-]
+# Public names and the submodules that provide them; resolved lazily via
+# PEP 562 so importing archgraph (e.g. for the CLI) does not pull in
+# networkx, graphviz, astroid, and openai up front
+_EXPORTS = {
+    "CodeAnalyzer": "archgraph.analyzer",
+    "ClassDiagramGenerator": "archgraph.generators",
+    "DependencyGraphGenerator": "archgraph.generators",
+    "CallGraphGenerator": "archgraph.generators",
+    "PackageStructureGenerator": "archgraph.generators",
+    "DiagramExporter": "archgraph.exporters",
+    "StructurizrExporter": "archgraph.exporters",
+    "LLMAnalyzer": "archgraph.llm_analyzer",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Resolve re-exported names on first access.
+
+    Args:
+        name: Attribute being looked up
+
+    Returns:
+        The re-exported object
+
+    Raises:
+        AttributeError: If the name is not part of the public API
+    """
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,88 @@
+"""Process-level cache of analyzed projects shared by the CLI and MCP server."""
+
+import hashlib
+import os
+from pathlib import Path
+
+from archgraph.analyzer import _SKIP_DIRS, CodeAnalyzer
+
+# Most recently analyzed projects, keyed by (path, excludes, fingerprint).
+# jobs and ast_cache change how an analysis runs, not its results, so they
+# stay out of the key; a memo hit skips the tree walk entirely.
+_MAX_ENTRIES = 8
+_analyzers: dict[tuple[str, tuple[str, ...], str], CodeAnalyzer] = {}
+
+
+def tree_fingerprint(path: Path) -> str:
+    """Compute a cheap fingerprint of the Python files in a project tree.
+
+    Hashes the sorted (path, mtime, size) bundle of every .py file, so any
+    added, removed, or modified file changes the fingerprint — including
+    edits that do not advance the newest mtime in the tree. Directories
+    the analyzer never looks at (__pycache__, in-tree virtualenvs) are
+    pruned so they neither slow the stat pass nor invalidate the memo.
+
+    Args:
+        path: Project root directory
+
+    Returns:
+        Hex digest over the per-file stat signatures, used as a cache key
+    """
+    signatures = []
+    stack = [str(path)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".py"):
+                        st = entry.stat()
+                        signatures.append(
+                            f"{entry.path}\0{st.st_mtime_ns}\0{st.st_size}\n"
+                        )
+                except OSError:
+                    continue
+    h = hashlib.sha1()
+    for signature in sorted(signatures):
+        h.update(signature.encode())
+    return h.hexdigest()
+
+
+def get_analyzer(
+    path: str | Path,
+    exclude_patterns: tuple[str, ...] = (),
+    *,
+    jobs: int | None = None,
+    ast_cache=None,
+) -> CodeAnalyzer:
+    """Get an analyzed CodeAnalyzer for a project, reusing prior results.
+
+    Repeated calls for an unchanged tree with the same exclude patterns
+    return the same instance, so subcommands invoked in one process (tests,
+    the MCP server, library callers) analyze each project at most once.
+
+    Args:
+        path: Project root directory
+        exclude_patterns: Patterns to exclude from analysis
+        jobs: Number of parser worker processes (default: CPU count)
+        ast_cache: Optional on-disk AstCache consulted on a memo miss
+
+    Returns:
+        Analyzed CodeAnalyzer instance
+    """
+    resolved = Path(path).resolve()
+    key = (str(resolved), tuple(exclude_patterns), tree_fingerprint(resolved))
+    analyzer = _analyzers.get(key)
+    if analyzer is None:
+        analyzer = CodeAnalyzer(resolved, ast_cache=ast_cache, max_workers=jobs)
+        analyzer.analyze(exclude_patterns=list(exclude_patterns))
+        if len(_analyzers) >= _MAX_ENTRIES:
+            _analyzers.pop(next(iter(_analyzers)))
+        _analyzers[key] = analyzer
+    return analyzer
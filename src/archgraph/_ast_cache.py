@@ -0,0 +1,136 @@
+"""Persistent on-disk cache of per-file analysis summaries."""
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any
+
+log = logging.getLogger(__name__)
+
+# Bump whenever the cached summary format changes
+_CACHE_FORMAT = 4
+
+
+class AstCache:
+    """Stores per-file analysis summaries keyed by file stat signature.
+
+    Entries are validated by a file's mtime and size first; when only the
+    stat signature changed (a touch, a branch switch and back), a sha256
+    content hash rescues the entry and refreshes its signature. Entries
+    written by a different interpreter or cache format are discarded.
+    Unchanged files skip the parse entirely on subsequent runs.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store cache entries in (created if missing)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, file_path: Path) -> Any | None:
+        """Look up the cached summary for a file.
+
+        Args:
+            file_path: Path to the source file
+
+        Returns:
+            The cached summary, or None on miss or stale entry
+        """
+        try:
+            key = self._key(file_path)
+            with open(self._entry_path(file_path), "rb") as f:
+                stored_key, digest, result = pickle.load(f)
+        except Exception:
+            # Unpickling stale entries can raise nearly anything — an entry
+            # from an older release may reference renamed classes or carry a
+            # shape the current code no longer accepts. Any failure here is
+            # just a miss; the file gets reparsed and the entry rewritten.
+            self.misses += 1
+            return None
+
+        if stored_key != key:
+            # The stat signature moved but the bytes may not have; fall
+            # back to the content hash before paying for a reparse
+            try:
+                current = hashlib.sha256(file_path.read_bytes()).digest()
+            except OSError:
+                self.misses += 1
+                return None
+            if current != digest:
+                self.misses += 1
+                return None
+            # Refresh the signature so the next lookup is stat-only again
+            self._write_entry(file_path, key, digest, result)
+
+        self.hits += 1
+        return result
+
+    def put(self, file_path: Path, result: Any) -> None:
+        """Store the summary for a file.
+
+        Args:
+            file_path: Path to the source file
+            result: Summary to cache
+        """
+        try:
+            digest = hashlib.sha256(file_path.read_bytes()).digest()
+            key = self._key(file_path)
+        except OSError as e:
+            log.warning("Could not hash %s for caching: %s", file_path, e)
+            return
+        self._write_entry(file_path, key, digest, result)
+
+    def _write_entry(
+        self, file_path: Path, key: tuple, digest: bytes, result: Any
+    ) -> None:
+        """Write one cache entry to disk.
+
+        Args:
+            file_path: Path to the source file
+            key: Freshness key from _key
+            digest: sha256 digest of the file contents
+            result: Summary to cache
+        """
+        entry_path = self._entry_path(file_path)
+        tmp_path = entry_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(
+                    (key, digest, result), f, protocol=pickle.HIGHEST_PROTOCOL
+                )
+            # Atomic replace so concurrent readers never see partial writes
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            log.warning("Could not write cache entry for %s: %s", file_path, e)
+
+    def _entry_path(self, file_path: Path) -> Path:
+        """Get the cache entry path for a source file.
+
+        Args:
+            file_path: Path to the source file
+
+        Returns:
+            Path of the pickle file holding the entry
+        """
+        digest = hashlib.sha1(str(file_path).encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.pkl"
+
+    def _key(self, file_path: Path) -> tuple[int, int, int, int]:
+        """Build the freshness key for a source file.
+
+        Args:
+            file_path: Path to the source file
+
+        Returns:
+            Tuple of (mtime_ns, size, interpreter version, cache format)
+        """
+        st = file_path.stat()
+        return (st.st_mtime_ns, st.st_size, sys.hexversion, _CACHE_FORMAT)
@@ -1,95 +1,767 @@
 """Code analyzer module for parsing Python source files and extracting structural information."""
 
 import ast
+import logging
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, NamedTuple
 
 import astroid
 from astroid import nodes
 
+from archgraph._ast_cache import AstCache
+
+log = logging.getLogger(__name__)
+
+# Below this many files the pool spawn overhead outweighs the parallel speedup.
+_MIN_FILES_FOR_POOL = 8
+
+# Files larger than this are almost always vendored or generated (pb2 stubs,
+# migrations) and would dominate parse time; skip them by default.
+_MAX_FILE_BYTES = 1024 * 1024
+
+# Auto-generated file markers looked for in the first few hundred bytes
+_GENERATED_MARKERS = (b"Generated by", b"DO NOT EDIT", b"@generated")
+
+# Directory names pruned at traversal time, skipping their entire subtrees
+_SKIP_DIRS = frozenset({"__pycache__", ".venv"})
+
+# Ask CPython for the optimized AST (constant folding done in C) where the
+# interpreter supports it (3.13+); dont_inherit keeps any __future__ flags
+# active in this module from leaking into the compile.
+_PARSE_FLAGS = ast.PyCF_ONLY_AST | getattr(ast, "PyCF_OPTIMIZED_AST", 0)
+
+# Directories that are always skipped, folded into the exclude regex so the
+# per-file check is a single C-level search instead of a path.parts scan.
+_ALWAYS_EXCLUDE = r"(?:^|/)(?:__pycache__|\.venv)/"
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate one glob pattern into a regex fragment.
+
+    Unlike fnmatch.translate, '*' and '?' stop at path separators, so
+    'test_*' matches trailing path components the way path.match() does
+    instead of swallowing everything under a matching directory.
+
+    Args:
+        pattern: Glob pattern (supports '*', '?', and '[...]' classes)
+
+    Returns:
+        Unanchored regex source matching the pattern
+    """
+    parts = []
+    i = 0
+    length = len(pattern)
+    while i < length:
+        ch = pattern[i]
+        if ch == "*":
+            parts.append("[^/]*")
+        elif ch == "?":
+            parts.append("[^/]")
+        elif ch == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                parts.append(r"\[")
+            else:
+                inner = pattern[i + 1 : end]
+                if inner.startswith("!"):
+                    inner = "^" + inner[1:]
+                parts.append(f"[{inner}]")
+                i = end
+        else:
+            parts.append(re.escape(ch))
+        i += 1
+    return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def _compile_exclude_patterns(exclude_patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile glob exclude patterns into a single alternation regex.
+
+    Matching one compiled regex per file replaces the O(files x patterns)
+    fnmatch translation that path.match() performs on every call; the
+    cache skips recompilation when the same patterns are analyzed again.
+
+    Args:
+        exclude_patterns: Glob patterns to exclude (e.g., ('test_*',))
+
+    Returns:
+        Compiled regex matching any excluded path
+    """
+    alternatives = [_ALWAYS_EXCLUDE]
+    for pattern in exclude_patterns:
+        # Anchored at component boundaries to mirror path.match(), which
+        # only tests a path's trailing components against the pattern
+        alternatives.append(rf"(?:^|/){_translate_glob(pattern)}\Z")
+    return re.compile("|".join(alternatives))
+
+
+class ImportRef(NamedTuple):
+    """One imported name, indexable like the (name, alias) tuple it replaces."""
+
+    full_name: str
+    alias: str | None
+
+
+@dataclass(slots=True)
+class FunctionInfo:
+    """Lightweight summary of a function or method."""
+
+    name: str
+    args: list[str] = field(default_factory=list)
+    returns: str = ""
+
+
+@dataclass(slots=True)
+class ClassInfo:
+    """Lightweight summary of a class definition."""
+
+    name: str
+    bases: list[str] = field(default_factory=list)
+    methods: list[FunctionInfo] = field(default_factory=list)
+    attributes: list[str] = field(default_factory=list)
+    docstring: str = ""
+
+
+@dataclass(slots=True)
+class ModuleInfo:
+    """All per-module analysis results, kept together in one record.
+
+    The collections are tuples: they never grow once a file is merged, and
+    tuples drop the list over-allocation slack on every module.
+    """
+
+    path: Path
+    classes: tuple[ClassInfo, ...] = ()
+    functions: tuple[FunctionInfo, ...] = ()
+    imports: tuple[ImportRef, ...] = ()
+
+
+def _parse_one(
+    root_path: Path, file_path: Path, use_astroid: bool = False
+) -> (
+    tuple[
+        str,
+        Path,
+        list[ClassInfo],
+        list[FunctionInfo],
+        list[ImportRef],
+        list[tuple[str, str]],
+    ]
+    | None
+):
+    """Parse and summarize a single Python file.
+
+    Module-level so it can be dispatched to worker processes; astroid node
+    objects pickle poorly, so only lightweight summaries are returned.
+
+    Args:
+        root_path: Root directory of the analyzed project
+        file_path: Path to the Python file
+        use_astroid: Parse with astroid instead of the stdlib ast module
+
+    Returns:
+        Tuple of (module_name, file_path, classes, functions, imports,
+        call_relationships), or None if the file could not be analyzed
+    """
+    try:
+        # Raw bytes skip the text-mode decode; the compiler accepts bytes
+        # and handles the PEP 263 coding cookie itself
+        with open(file_path, "rb") as f:
+            content = f.read()
+
+        # Skip auto-generated files before paying for the parse
+        head = content[:256]
+        if any(marker in head for marker in _GENERATED_MARKERS):
+            return None
+
+        if use_astroid:
+            # astroid builds a fully-inferable semantic tree and needs text
+            module: Any = astroid.parse(
+                content.decode("utf-8"), module_name=str(file_path)
+            )
+        else:
+            # The default extraction only needs syntax, so the C-compiled
+            # stdlib parser is the far cheaper choice
+            module = compile(
+                content, str(file_path), "exec", flags=_PARSE_FLAGS, dont_inherit=True
+            )
+    except SyntaxError as e:
+        # Broken sources are expected in the wild; report just the location
+        # and message rather than stringifying the whole SyntaxError, which
+        # renders the offending line and caret markers
+        log.warning("Syntax error in %s:%s: %s", file_path, e.lineno, e.msg)
+        return None
+    except Exception as e:
+        # Log error but continue with other files; lazy %-formatting skips the
+        # string build when warnings are filtered, and the logging machinery
+        # does not serialize pool workers on stdout the way print does
+        log.warning("Could not analyze %s: %s", file_path, e)
+        return None
+
+    module_name = _module_name_for(root_path, file_path)
+    extract = _extract_module_astroid if use_astroid else _extract_module_ast
+    classes, functions, imports, call_relationships = extract(module, module_name)
+
+    return module_name, file_path, classes, functions, imports, call_relationships
+
+
+@lru_cache(maxsize=None)
+def _module_name_for(root_path: Path, file_path: Path) -> str:
+    """Convert file path to module name.
+
+    Args:
+        root_path: Root directory of the analyzed project
+        file_path: Path to Python file
+
+    Returns:
+        Module name (e.g., 'package.subpackage.module')
+    """
+    # Pure string slicing; Path.relative_to/parts would allocate a PurePath
+    # and a parts tuple per file for what is a substring and a replace
+    relative = str(file_path)[len(str(root_path)) + 1 :]
+    name = relative.removesuffix(".py").replace(os.sep, ".")
+
+    # Remove __init__ from the end
+    if name == "__init__":
+        name = ""
+    else:
+        name = name.removesuffix(".__init__")
+
+    # Interned names make the dict keys used across the analyzer state
+    # pointer-comparable and deduplicated
+    return sys.intern(name or "__main__")
+
+
+@lru_cache(maxsize=None)
+def _base_module(name: str) -> str:
+    """Get the base (top-level) module of a dotted import name.
+
+    Args:
+        name: Dotted import name
+
+    Returns:
+        First component of the name
+    """
+    return sys.intern(name.partition(".")[0])
+
+
+# Node-type sets for flat type(x) dispatch: ast nodes are never subclassed
+# here, so a pointer-hash set probe beats isinstance's subclass walk
+_AST_FUNCTION_DEFS = frozenset((ast.FunctionDef, ast.AsyncFunctionDef))
+_AST_SCOPE_DEFS = frozenset((ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))
+_AST_IMPORTS = frozenset((ast.Import, ast.ImportFrom))
+
+
+def _summarize_class_ast(cls: ast.ClassDef) -> ClassInfo:
+    """Build a lightweight summary of a class definition.
+
+    Args:
+        cls: ast ClassDef node
+
+    Returns:
+        ClassInfo summary
+    """
+    methods = []
+    attributes = []
+
+    for node in cls.body:
+        if type(node) in _AST_FUNCTION_DEFS:
+            methods.append(_summarize_function_ast(node))
+        elif type(node) is ast.Assign:
+            for target in node.targets:
+                if type(target) is ast.Name:
+                    attributes.append(target.id)
+
+    # Include instance attributes assigned in methods (e.g., self.value = 0).
+    # Assignments are statements, so the descent only follows statement
+    # children (if/for/try/with bodies, nested defs) and never enters
+    # expression subtrees, which hold the bulk of a method's nodes.
+    stack: list[ast.stmt] = [
+        stmt for method in cls.body if type(method) in _AST_FUNCTION_DEFS
+        for stmt in method.body
+    ]
+    # The stack is LIFO, so seed and push children reversed to keep the
+    # attributes in source order, matching the astroid backend
+    stack.reverse()
+    while stack:
+        stmt = stack.pop()
+        if type(stmt) is ast.Assign:
+            targets = stmt.targets
+        elif type(stmt) is ast.AnnAssign:
+            targets = [stmt.target]
+        else:
+            targets = ()
+        for target in targets:
+            if (
+                type(target) is ast.Attribute
+                and type(target.value) is ast.Name
+                and target.value.id == "self"
+                and target.attr not in attributes
+            ):
+                attributes.append(target.attr)
+        for child in reversed(
+            [c for c in ast.iter_child_nodes(stmt) if isinstance(c, ast.stmt)]
+        ):
+            stack.append(child)
+
+    return ClassInfo(
+        name=cls.name,
+        bases=[ast.unparse(base) for base in cls.bases],
+        methods=methods,
+        attributes=attributes,
+        docstring=ast.get_docstring(cls, clean=False) or "",
+    )
+
+
+def _summarize_function_ast(func: ast.FunctionDef | ast.AsyncFunctionDef) -> FunctionInfo:
+    """Build a lightweight summary of a function definition.
+
+    Args:
+        func: ast FunctionDef or AsyncFunctionDef node
+
+    Returns:
+        FunctionInfo summary
+    """
+    return FunctionInfo(
+        name=func.name,
+        args=[arg.arg for arg in func.args.args],
+        returns=ast.unparse(func.returns) if func.returns is not None else "",
+    )
+
+
+def _extract_imports_ast(
+    node: ast.Import | ast.ImportFrom, imports: list[ImportRef]
+) -> None:
+    """Extract import statements.
+
+    Args:
+        node: Import or ImportFrom node
+        imports: List to append ImportRef entries to
+    """
+    if type(node) is ast.Import:
+        for alias in node.names:
+            imports.append(ImportRef(sys.intern(alias.name), alias.asname))
+    else:
+        base_module = node.module or ""
+        for alias in node.names:
+            full_name = f"{base_module}.{alias.name}" if base_module else alias.name
+            imports.append(ImportRef(sys.intern(full_name), alias.asname))
+
+
+def _extract_module_ast(
+    module: ast.Module, module_name: str
+) -> tuple[
+    list[ClassInfo],
+    list[FunctionInfo],
+    list[ImportRef],
+    list[tuple[str, str]],
+]:
+    """Extract classes, functions, imports, and calls in a single traversal.
+
+    ast counterpart of _extract_module_astroid: top-level definitions and
+    imports are summarized from module.body, then one scope-tracking
+    descent records call relationships.
+
+    Args:
+        module: ast Module node
+        module_name: Name of the module
+
+    Returns:
+        Tuple of (classes, functions, imports, call_relationships)
+    """
+    classes: list[ClassInfo] = []
+    functions: list[FunctionInfo] = []
+    imports: list[ImportRef] = []
+    call_relationships: list[tuple[str, str]] = []
+
+    for node in module.body:
+        node_type = type(node)
+        if node_type is ast.ClassDef:
+            classes.append(_summarize_class_ast(node))
+        elif node_type in _AST_FUNCTION_DEFS:
+            functions.append(_summarize_function_ast(node))
+        elif node_type in _AST_IMPORTS:
+            _extract_imports_ast(node, imports)
+
+    stack: list[tuple[ast.AST, str | None]] = [
+        (node, None) for node in reversed(module.body)
+    ]
+
+    while stack:
+        node, scope = stack.pop()
+        node_type = type(node)
+        if node_type in _AST_SCOPE_DEFS:
+            scope = node.name
+        elif node_type is ast.Call:
+            if scope and type(node.func) is ast.Name:
+                call_relationships.append(
+                    (sys.intern(f"{module_name}.{scope}"), sys.intern(node.func.id))
+                )
+        for child in reversed(list(ast.iter_child_nodes(node))):
+            stack.append((child, scope))
+
+    return classes, functions, imports, call_relationships
+
+
+def _summarize_class_astroid(cls: nodes.ClassDef) -> ClassInfo:
+    """Build a lightweight summary of a class definition.
+
+    Args:
+        cls: astroid ClassDef node
+
+    Returns:
+        ClassInfo summary
+    """
+    methods = []
+    attributes = []
+
+    for node in cls.body:
+        if isinstance(node, nodes.FunctionDef):
+            methods.append(_summarize_function_astroid(node))
+        elif isinstance(node, nodes.Assign):
+            for target in node.targets:
+                if isinstance(target, nodes.AssignName):
+                    attributes.append(target.name)
+
+    # Include instance attributes assigned in methods (e.g., self.value = 0)
+    for attr_name in cls.instance_attrs:
+        if attr_name not in attributes:
+            attributes.append(attr_name)
+
+    return ClassInfo(
+        name=cls.name,
+        bases=[_get_name(base) for base in cls.bases],
+        methods=methods,
+        attributes=attributes,
+        docstring=cls.doc_node.value if cls.doc_node else "",
+    )
+
+
+def _summarize_function_astroid(func: nodes.FunctionDef) -> FunctionInfo:
+    """Build a lightweight summary of a function definition.
+
+    Args:
+        func: astroid FunctionDef node
+
+    Returns:
+        FunctionInfo summary
+    """
+    return FunctionInfo(
+        name=func.name,
+        args=[arg.name for arg in func.args.args],
+        returns=_get_annotation_str(func.returns),
+    )
+
+
+def _extract_imports_astroid(
+    node: nodes.Import | nodes.ImportFrom, imports: list[ImportRef]
+) -> None:
+    """Extract import statements.
+
+    Args:
+        node: Import or ImportFrom node
+        imports: List to append ImportRef entries to
+    """
+    if isinstance(node, nodes.Import):
+        for name, alias in node.names:
+            imports.append(ImportRef(sys.intern(name), alias))
+    elif isinstance(node, nodes.ImportFrom):
+        base_module = node.modname or ""
+        for name, alias in node.names:
+            full_name = f"{base_module}.{name}" if base_module else name
+            imports.append(ImportRef(sys.intern(full_name), alias))
+
+
+def _extract_module_astroid(
+    module: nodes.Module, module_name: str
+) -> tuple[
+    list[ClassInfo],
+    list[FunctionInfo],
+    list[ImportRef],
+    list[tuple[str, str]],
+]:
+    """Extract classes, functions, imports, and call relationships.
+
+    Call nodes are collected via astroid's nodes_of_class instead of a
+    hand-rolled per-node descent, so the traversal happens inside
+    astroid's optimized walker rather than one Python frame per node.
+
+    Args:
+        module: astroid Module node
+        module_name: Name of the module
+
+    Returns:
+        Tuple of (classes, functions, imports, call_relationships)
+    """
+    classes: list[ClassInfo] = []
+    functions: list[FunctionInfo] = []
+    imports: list[ImportRef] = []
+    call_relationships: list[tuple[str, str]] = []
+
+    for node in module.body:
+        if isinstance(node, nodes.ClassDef):
+            classes.append(_summarize_class_astroid(node))
+        elif isinstance(node, nodes.FunctionDef):
+            functions.append(_summarize_function_astroid(node))
+        elif isinstance(node, (nodes.Import, nodes.ImportFrom)):
+            _extract_imports_astroid(node, imports)
+
+    for call in module.nodes_of_class(nodes.Call):
+        if not hasattr(call.func, "name"):
+            continue
+        scope = call.scope()
+        if isinstance(scope, (nodes.FunctionDef, nodes.ClassDef)):
+            call_relationships.append(
+                (sys.intern(f"{module_name}.{scope.name}"), sys.intern(call.func.name))
+            )
+
+    return classes, functions, imports, call_relationships
+
+
+def _get_annotation_str(annotation: Any) -> str:
+    """Get string representation of type annotation.
+
+    Args:
+        annotation: Type annotation node
+
+    Returns:
+        String representation
+    """
+    if annotation is None:
+        return ""
+    if hasattr(annotation, "as_string"):
+        return annotation.as_string()
+    return str(annotation)
+
+
+def _get_name(node: Any) -> str:
+    """Get name from a node.
+
+    Args:
+        node: AST node
+
+    Returns:
+        Name string
+    """
+    if isinstance(node, nodes.Name):
+        return node.name
+    if isinstance(node, nodes.Attribute):
+        return node.as_string()
+    return str(node)
 
-class CodeAnalyzer:
-    """Analyzes Python code to extract architectural information."""
 
-    def __init__(self, root_path: str | Path):
+class CodeAnalyzer:
+    """Analyzes Python code to extract architectural information.
+
+    Parsed trees are discarded as soon as each file's summary is
+    extracted; only the lightweight summaries consumed by the generators
+    are retained, so memory stays flat regardless of project size.
+    """
+
+    def __init__(
+        self,
+        root_path: str | Path,
+        use_astroid: bool = False,
+        max_file_bytes: int = _MAX_FILE_BYTES,
+        ast_cache: AstCache | None = None,
+        max_workers: int | None = None,
+    ):
         """Initialize the code analyzer.
 
         Args:
             root_path: Root directory of the Python project to analyze
+            use_astroid: Parse with astroid instead of the stdlib ast module;
+                slower, but available when semantic inference is wanted
+            max_file_bytes: Files larger than this are skipped as likely
+                generated/vendored code
+            ast_cache: Optional persistent cache of per-file summaries;
+                unchanged files skip the parse on subsequent runs. When not
+                given, the ARCHGRAPH_CACHE_DIR environment variable can
+                name a cache directory to opt in (useful for CI reruns)
+            max_workers: Number of parser worker processes; defaults to the
+                CPU count. 1 forces in-process parsing.
         """
         self.root_path = Path(root_path).resolve()
-        self.modules: dict[str, nodes.Module] = {}
-        self.classes: dict[str, list[nodes.ClassDef]] = {}
-        self.functions: dict[str, list[nodes.FunctionDef]] = {}
-        self.imports: dict[str, list[tuple[str, str | None]]] = {}
-        self.call_relationships: list[tuple[str, str]] = []
+        self.use_astroid = use_astroid
+        self.max_file_bytes = max_file_bytes
+        if ast_cache is None:
+            cache_dir = os.environ.get("ARCHGRAPH_CACHE_DIR")
+            if cache_dir:
+                ast_cache = AstCache(cache_dir)
+        self.ast_cache = ast_cache
+        self.max_workers = max_workers
+        # One record per module instead of four parallel dicts; the classic
+        # dict interfaces below are lazily built views over this store
+        self.module_info: dict[str, ModuleInfo] = {}
+        # Set-valued: duplicate call edges are collapsed at insertion instead
+        # of being deduplicated downstream during graph construction
+        self.call_relationships: set[tuple[str, str]] = set()
+        # Derived views are immutable once analyze() completes, so all are
+        # computed lazily and cached
+        self._modules_view: dict[str, Path] | None = None
+        self._classes_view: dict[str, tuple[ClassInfo, ...]] | None = None
+        self._functions_view: dict[str, tuple[FunctionInfo, ...]] | None = None
+        self._imports_view: dict[str, tuple[ImportRef, ...]] | None = None
+        self._deps_cache: dict[str, set[str]] | None = None
+        self._pkg_cache: dict[str, Any] | None = None
+
+    @property
+    def modules(self) -> dict[str, Path]:
+        """Mapping of module name to source file path."""
+        if self._modules_view is None:
+            self._modules_view = {
+                name: info.path for name, info in self.module_info.items()
+            }
+        return self._modules_view
+
+    @property
+    def classes(self) -> dict[str, tuple[ClassInfo, ...]]:
+        """Mapping of module name to its classes, for modules that have any."""
+        if self._classes_view is None:
+            self._classes_view = {
+                name: info.classes
+                for name, info in self.module_info.items()
+                if info.classes
+            }
+        return self._classes_view
+
+    @property
+    def functions(self) -> dict[str, tuple[FunctionInfo, ...]]:
+        """Mapping of module name to its functions, for modules that have any."""
+        if self._functions_view is None:
+            self._functions_view = {
+                name: info.functions
+                for name, info in self.module_info.items()
+                if info.functions
+            }
+        return self._functions_view
+
+    @property
+    def imports(self) -> dict[str, tuple[ImportRef, ...]]:
+        """Mapping of module name to its imports, for modules that have any."""
+        if self._imports_view is None:
+            self._imports_view = {
+                name: info.imports
+                for name, info in self.module_info.items()
+                if info.imports
+            }
+        return self._imports_view
 
     def analyze(self, exclude_patterns: list[str] | None = None) -> None:
         """Analyze all Python files in the root path.
 
+        Files are parsed in a process pool since parsing is CPU-bound;
+        small projects are parsed in-process to avoid the pool spawn overhead.
+
         Args:
             exclude_patterns: List of glob patterns to exclude (e.g., ['test_*', '*_test.py'])
         """
         exclude_patterns = exclude_patterns or []
+        self._modules_view = None
+        self._classes_view = None
+        self._functions_view = None
+        self._imports_view = None
+        self._deps_cache = None
+        self._pkg_cache = None
         python_files = self._find_python_files(exclude_patterns)
 
-        for file_path in python_files:
-            self._analyze_file(file_path)
+        parse = partial(_parse_one, self.root_path, use_astroid=self.use_astroid)
 
-    def _find_python_files(self, exclude_patterns: list[str]) -> list[Path]:
-        """Find all Python files in the root path.
+        if self.ast_cache is not None:
+            # Satisfy unchanged files from the cache; only misses are parsed
+            misses = []
+            for file_path in python_files:
+                cached = self.ast_cache.get(file_path)
+                if cached is not None:
+                    self._merge_results([cached])
+                else:
+                    misses.append(file_path)
+            python_files = iter(misses)
+
+        # Peek at the stream to decide whether the pool is worth spawning;
+        # workers start parsing while directory traversal is still running.
+        head = list(islice(python_files, _MIN_FILES_FOR_POOL))
+        if len(head) < _MIN_FILES_FOR_POOL or self.max_workers == 1:
+            self._merge_results(map(parse, chain(head, python_files)), store=True)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers or os.cpu_count()
+            ) as executor:
+                self._merge_results(
+                    executor.map(parse, chain(head, python_files), chunksize=16),
+                    store=True,
+                )
+
+    def _merge_results(self, results: Any, store: bool = False) -> None:
+        """Merge per-file parse results into the analyzer state.
 
         Args:
-            exclude_patterns: Patterns to exclude
-
-        Returns:
-            List of Python file paths
+            results: Iterable of _parse_one results
+            store: Write each result to the on-disk cache, if one is configured
         """
-        python_files = []
-        for path in self.root_path.rglob("*.py"):
-            # Skip if matches any exclude pattern
-            if any(path.match(pattern) for pattern in exclude_patterns):
+        cache = self.ast_cache if store else None
+        for result in results:
+            if result is None:
                 continue
-            # Skip __pycache__ and .venv directories
-            if "__pycache__" in path.parts or ".venv" in path.parts:
-                continue
-            python_files.append(path)
-        return python_files
-
-    def _analyze_file(self, file_path: Path) -> None:
-        """Analyze a single Python file.
+            if cache is not None:
+                cache.put(result[1], result)
+            module_name, file_path, classes, functions, imports, call_relationships = (
+                result
+            )
+            # Re-intern here: names interned inside pool workers (or loaded
+            # from the on-disk cache) arrive as fresh string objects
+            module_name = sys.intern(module_name)
+            self.module_info[module_name] = ModuleInfo(
+                file_path, tuple(classes), tuple(functions), tuple(imports)
+            )
+            self.call_relationships.update(call_relationships)
+
+    def _find_python_files(self, exclude_patterns: list[str]) -> Iterator[Path]:
+        """Find all Python files in the root path.
 
         Args:
-            file_path: Path to the Python file
+            exclude_patterns: Patterns to exclude
+
+        Yields:
+            Python file paths as the directory tree is traversed
         """
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Parse with astroid for better semantic analysis
-            module = astroid.parse(content, module_name=str(file_path))
-            module_name = self._get_module_name(file_path)
-
-            self.modules[module_name] = module
-            self.classes[module_name] = []
-            self.functions[module_name] = []
-            self.imports[module_name] = []
-
-            # Extract classes, functions, and imports
-            for node in module.body:
-                if isinstance(node, nodes.ClassDef):
-                    self.classes[module_name].append(node)
-                elif isinstance(node, nodes.FunctionDef):
-                    self.functions[module_name].append(node)
-                elif isinstance(node, (nodes.Import, nodes.ImportFrom)):
-                    self._extract_imports(node, module_name)
-
-            # Extract call relationships
-            self._extract_calls(module, module_name)
-
-        except Exception as e:
-            # Log error but continue with other files
-            print(f"Warning: Could not analyze {file_path}: {e}")
+        exclude_re = _compile_exclude_patterns(tuple(exclude_patterns))
+        max_bytes = self.max_file_bytes
+
+        # os.scandir yields DirEntry objects with cached stat results and
+        # prunes skipped directories before their subtrees are ever visited,
+        # unlike rglob which allocates a Path per entry and filters after
+        stack = [str(self.root_path)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _SKIP_DIRS:
+                                stack.append(entry.path)
+                            continue
+                        if not entry.name.endswith(".py"):
+                            continue
+                        if exclude_re.search(entry.path.replace(os.sep, "/")):
+                            continue
+                        # Outlier mega-files (generated stubs, migrations)
+                        # dominate parse time; skip before they reach the parser
+                        if entry.stat().st_size > max_bytes:
+                            continue
+                    except OSError:
+                        continue
+                    yield Path(entry.path)
 
     def _get_module_name(self, file_path: Path) -> str:
         """Convert file path to module name.
@@ -100,65 +772,27 @@ class CodeAnalyzer:
         Returns:
             Module name (e.g., 'package.subpackage.module')
         """
-        relative_path = file_path.relative_to(self.root_path)
-        parts = list(relative_path.parts[:-1]) + [relative_path.stem]
+        return _module_name_for(self.root_path, file_path)
 
-        # Remove __init__ from the end
-        if parts[-1] == "__init__":
-            parts = parts[:-1]
+    def find_module(self, name: str) -> str | None:
+        """Find an analyzed module by exact name or dotted-name suffix.
 
-        return ".".join(parts) if parts else "__main__"
-
-    def _extract_imports(
-        self, node: nodes.Import | nodes.ImportFrom, module_name: str
-    ) -> None:
-        """Extract import statements.
-
-        Args:
-            node: Import or ImportFrom node
-            module_name: Name of the module containing the import
-        """
-        if isinstance(node, nodes.Import):
-            for name, alias in node.names:
-                self.imports[module_name].append((name, alias))
-        elif isinstance(node, nodes.ImportFrom):
-            base_module = node.modname or ""
-            for name, alias in node.names:
-                full_name = f"{base_module}.{name}" if base_module else name
-                self.imports[module_name].append((full_name, alias))
-
-    def _extract_calls(self, node: Any, module_name: str) -> None:
-        """Extract function/method call relationships.
-
-        Args:
-            node: AST node to traverse
-            module_name: Name of the module
-        """
-        if isinstance(node, nodes.Call):
-            if hasattr(node.func, "name"):
-                caller = self._get_current_function(node)
-                callee = node.func.name
-                if caller:
-                    self.call_relationships.append((f"{module_name}.{caller}", callee))
-
-        # Recursively traverse child nodes
-        for child in node.get_children():
-            self._extract_calls(child, module_name)
-
-    def _get_current_function(self, node: Any) -> str | None:
-        """Get the name of the function containing the given node.
+        An exact match is a single dict lookup; otherwise the first module
+        whose name ends with '.<name>' is returned, so callers can resolve
+        'module_b' to 'mypackage.module_b' without scanning substrings.
 
         Args:
-            node: AST node
+            name: Module name or trailing dotted-name component(s)
 
         Returns:
-            Function name or None
+            The full module name, or None if nothing matches
         """
-        current = node
-        while current:
-            if isinstance(current, (nodes.FunctionDef, nodes.ClassDef)):
-                return current.name
-            current = current.parent if hasattr(current, "parent") else None
+        if name in self.module_info:
+            return name
+        suffix = "." + name
+        for module_name in self.module_info:
+            if module_name.endswith(suffix):
+                return module_name
         return None
 
     def get_class_info(self, module_name: str, class_name: str) -> dict[str, Any]:
@@ -171,84 +805,46 @@ class CodeAnalyzer:
         Returns:
             Dictionary with class information
         """
-        if module_name not in self.classes:
-            return {}
-
-        for cls in self.classes[module_name]:
+        info = self.module_info.get(module_name)
+        for cls in info.classes if info is not None else ():
             if cls.name == class_name:
-                methods = []
-                attributes = []
-
-                for node in cls.body:
-                    if isinstance(node, nodes.FunctionDef):
-                        methods.append(
-                            {
-                                "name": node.name,
-                                "args": [arg.name for arg in node.args.args],
-                                "returns": self._get_annotation_str(node.returns),
-                            }
-                        )
-                    elif isinstance(node, nodes.Assign):
-                        for target in node.targets:
-                            if isinstance(target, nodes.AssignName):
-                                attributes.append(target.name)
-
                 return {
                     "name": cls.name,
-                    "bases": [self._get_name(base) for base in cls.bases],
-                    "methods": methods,
-                    "attributes": attributes,
-                    "docstring": cls.doc_node.value if cls.doc_node else "",
+                    "bases": list(cls.bases),
+                    "methods": [
+                        {
+                            "name": method.name,
+                            "args": list(method.args),
+                            "returns": method.returns,
+                        }
+                        for method in cls.methods
+                    ],
+                    "attributes": list(cls.attributes),
+                    "docstring": cls.docstring,
                 }
 
         return {}
 
-    def _get_annotation_str(self, annotation: Any) -> str:
-        """Get string representation of type annotation.
-
-        Args:
-            annotation: Type annotation node
-
-        Returns:
-            String representation
-        """
-        if annotation is None:
-            return ""
-        if hasattr(annotation, "as_string"):
-            return annotation.as_string()
-        return str(annotation)
-
-    def _get_name(self, node: Any) -> str:
-        """Get name from a node.
-
-        Args:
-            node: AST node
-
-        Returns:
-            Name string
-        """
-        if isinstance(node, nodes.Name):
-            return node.name
-        if isinstance(node, nodes.Attribute):
-            return node.as_string()
-        return str(node)
-
     def get_dependencies(self) -> dict[str, set[str]]:
         """Get module dependency graph.
 
         Returns:
             Dictionary mapping module names to their dependencies
         """
+        if self._deps_cache is not None:
+            return self._deps_cache
+
         dependencies: dict[str, set[str]] = {}
 
-        for module_name, imports in self.imports.items():
+        # Import-free modules still get an (empty) entry so the dependency
+        # graph includes them as nodes
+        for module_name, info in self.module_info.items():
             deps = set()
-            for import_name, _ in imports:
-                # Extract base module name
-                base_module = import_name.split(".")[0]
-                deps.add(base_module)
+            for import_name, _ in info.imports:
+                deps.add(_base_module(import_name))
             dependencies[module_name] = deps
 
+        self._deps_cache = dependencies
         return dependencies
 
     def get_package_structure(self) -> dict[str, Any]:
@@ -257,29 +853,27 @@ class CodeAnalyzer:
         Returns:
             Nested dictionary representing package structure
         """
+        if self._pkg_cache is not None:
+            return self._pkg_cache
+
         structure: dict[str, Any] = {}
 
-        for module_name in self.modules.keys():
+        for module_name, info in self.module_info.items():
             parts = module_name.split(".")
             current = structure
 
-            for i, part in enumerate(parts):
-                if part not in current:
-                    current[part] = {
-                        "_modules": [],
-                        "_classes": [],
-                        "_functions": [],
-                    }
-
-                if i == len(parts) - 1:
-                    # Leaf node - add classes and functions
-                    current[part]["_classes"] = [
-                        cls.name for cls in self.classes.get(module_name, [])
-                    ]
-                    current[part]["_functions"] = [
-                        func.name for func in self.functions.get(module_name, [])
-                    ]
-                else:
-                    current = current[part]
+            # Intermediate packages are bare dicts; the metadata lists are
+            # only allocated at the leaf instead of for every path prefix
+            for part in parts[:-1]:
+                child = current.get(part)
+                if child is None:
+                    child = current[part] = {}
+                current = child
+
+            leaf = current.setdefault(parts[-1], {})
+            leaf["_modules"] = []
+            leaf["_classes"] = [cls.name for cls in info.classes]
+            leaf["_functions"] = [func.name for func in info.functions]
 
+        self._pkg_cache = structure
         return structure
@@ -1,31 +1,47 @@
 """Command-line interface for ArchGraph."""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
-
-from archgraph.analyzer import CodeAnalyzer
-from archgraph.exporters import (
-    GraphVizExporter,
-    MermaidExporter,
-    PlantUMLExporter,
-    StructurizrExporter,
-)
-from archgraph.generators import (
-    CallGraphGenerator,
-    ClassDiagramGenerator,
-    DependencyGraphGenerator,
-    PackageStructureGenerator,
-)
-from archgraph.llm_analyzer import LLMAnalyzer
+
+# The analyzer, exporter, and generator stacks (networkx, graphviz, astroid,
+# openai) dominate CLI cold-start, so they are imported inside the commands
+# that need them; formats and --help never pay for them.
+if TYPE_CHECKING:
+    from archgraph.analyzer import CodeAnalyzer
 
 console = Console()
 
+# Static help text printed by the formats command; one print of the joined
+# block means one pass through Rich's markup parser and one write
+_FORMATS_TEXT = """
+[bold cyan]Supported Output Formats[/bold cyan]
+
+[bold]Mermaid[/bold] (.mmd, .md)
+  • Markdown-compatible diagram format
+  • Can be rendered in GitHub, GitLab, and many editors
+  • Supports class diagrams, flowcharts, and graphs
+  • Recommended for documentation
+
+[bold]PlantUML[/bold] (.puml, .plantuml)
+  • Popular UML diagram format
+  • Requires PlantUML or online renderer to view
+  • Supports class and component diagrams
+  • Good for detailed UML documentation
+
+[bold]GraphViz[/bold] (.png, .svg, .pdf, .jpg)
+  • Direct image output using GraphViz
+  • Multiple layout engines available
+  • Best for presentations and reports
+  • Requires GraphViz to be installed
+
+[dim]Use --format option to select output format[/dim]"""
+
 
 @click.group()
 @click.version_option(version="0.1.0", prog_name="archgraph")
@@ -122,6 +138,17 @@ def main() -> None:
     default="png",
     help="GraphViz output format",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-parse all files instead of using the on-disk analysis cache",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    help="Number of parser worker processes (default: CPU count)",
+)
 def generate(
     path: Path,
     output: Path,
@@ -139,6 +166,8 @@ def generate(
     include_external: bool,
     graphviz_layout: str,
     graphviz_format: str,
+    no_cache: bool,
+    jobs: int | None,
 ) -> None:
     """Generate architecture diagrams from Python code.
 
@@ -148,7 +177,14 @@ def generate(
     if not any([class_diagram, dependency_graph, call_graph, package_structure]):
         all_diagrams = True
 
+    from archgraph._analysis import get_analyzer
+    from archgraph._ast_cache import AstCache
+
     try:
+        # Create output directory (the analysis cache lives underneath it)
+        output.mkdir(parents=True, exist_ok=True)
+        ast_cache = None if no_cache else AstCache(output / ".archgraph_cache")
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -156,74 +192,91 @@ def generate(
         ) as progress:
             # Analyze code
             task = progress.add_task("[cyan]Analyzing Python code...", total=None)
-            analyzer = CodeAnalyzer(path)
-            analyzer.analyze(exclude_patterns=list(exclude))
+            analyzer = get_analyzer(path, exclude, jobs=jobs, ast_cache=ast_cache)
             progress.update(task, completed=True)
 
-            # Create output directory
-            output.mkdir(parents=True, exist_ok=True)
-
             # Determine which exporters to use
             exporters = _get_exporters(format, graphviz_layout, graphviz_format)
 
-            # Generate diagrams
-            diagram_count = 0
+            # Collect the selected diagram jobs before running them
+            diagram_jobs: list[tuple[str, Any, dict[str, Any]]] = []
 
             if all_diagrams or class_diagram:
-                task = progress.add_task(
-                    "[cyan]Generating class diagram...", total=None
+                diagram_jobs.append(
+                    (
+                        "[cyan]Generating class diagram...",
+                        _generate_class_diagram,
+                        {
+                            "include_methods": not no_methods,
+                            "include_attributes": not no_attributes,
+                            "include_private": include_private,
+                            "max_depth": max_depth,
+                        },
+                    )
                 )
-                _generate_class_diagram(
-                    analyzer,
-                    exporters,
-                    output,
-                    include_methods=not no_methods,
-                    include_attributes=not no_attributes,
-                    include_private=include_private,
-                    max_depth=max_depth,
-                )
-                progress.update(task, completed=True)
-                diagram_count += 1
 
             if all_diagrams or dependency_graph:
-                task = progress.add_task(
-                    "[cyan]Generating dependency graph...", total=None
-                )
-                _generate_dependency_graph(
-                    analyzer,
-                    exporters,
-                    output,
-                    include_external=include_external,
-                    max_depth=max_depth,
+                diagram_jobs.append(
+                    (
+                        "[cyan]Generating dependency graph...",
+                        _generate_dependency_graph,
+                        {
+                            "include_external": include_external,
+                            "max_depth": max_depth,
+                        },
+                    )
                 )
-                progress.update(task, completed=True)
-                diagram_count += 1
 
             if all_diagrams or call_graph:
-                task = progress.add_task("[cyan]Generating call graph...", total=None)
-                _generate_call_graph(
-                    analyzer,
-                    exporters,
-                    output,
-                    include_external=include_external,
-                    max_depth=max_depth or 3,
+                diagram_jobs.append(
+                    (
+                        "[cyan]Generating call graph...",
+                        _generate_call_graph,
+                        {
+                            "include_external": include_external,
+                            "max_depth": max_depth or 3,
+                        },
+                    )
                 )
-                progress.update(task, completed=True)
-                diagram_count += 1
 
             if all_diagrams or package_structure:
-                task = progress.add_task(
-                    "[cyan]Generating package structure...", total=None
-                )
-                _generate_package_structure(
-                    analyzer, exporters, output, max_depth=max_depth
+                diagram_jobs.append(
+                    (
+                        "[cyan]Generating package structure...",
+                        _generate_package_structure,
+                        {"max_depth": max_depth},
+                    )
                 )
-                progress.update(task, completed=True)
-                diagram_count += 1
+
+            # Run the diagram types concurrently: GraphViz rendering forks a
+            # subprocess per diagram, so its latency overlaps with the text
+            # exporters' string building and disk writes
+            with ThreadPoolExecutor(max_workers=len(diagram_jobs)) as pool:
+                futures = []
+                for description, generate_fn, gen_options in diagram_jobs:
+                    task = progress.add_task(description, total=None)
+                    futures.append(
+                        (
+                            task,
+                            pool.submit(
+                                generate_fn, analyzer, exporters, output, **gen_options
+                            ),
+                        )
+                    )
+                for task, future in futures:
+                    future.result()
+                    progress.update(task, completed=True)
+
+            diagram_count = len(diagram_jobs)
 
         # Print summary
         console.print(f"\n[green]✓[/green] Generated {diagram_count} diagram(s)")
         console.print(f"[blue]→[/blue] Output directory: {output.resolve()}")
+        if ast_cache is not None:
+            console.print(
+                f"[dim]Analysis cache: {ast_cache.hits} hit(s), "
+                f"{ast_cache.misses} miss(es)[/dim]"
+            )
 
     except Exception as e:
         console.print(f"[red]✗[/red] Error: {e}", style="bold red")
@@ -238,11 +291,21 @@ def generate(
     multiple=True,
     help="Patterns to exclude",
 )
-def analyze(path: Path, exclude: tuple[str, ...]) -> None:
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    help="Number of parser worker processes (default: CPU count)",
+)
+def analyze(path: Path, exclude: tuple[str, ...], jobs: int | None) -> None:
     """Analyze Python code and display statistics.
 
     PATH: Directory containing Python code to analyze
     """
+    from rich.table import Table
+
+    from archgraph._analysis import get_analyzer
+
     try:
         with Progress(
             SpinnerColumn(),
@@ -250,8 +313,7 @@ def analyze(path: Path, exclude: tuple[str, ...]) -> None:
             console=console,
         ) as progress:
             task = progress.add_task("[cyan]Analyzing Python code...", total=None)
-            analyzer = CodeAnalyzer(path)
-            analyzer.analyze(exclude_patterns=list(exclude))
+            analyzer = get_analyzer(path, exclude, jobs=jobs)
             progress.update(task, completed=True)
 
         # Display statistics
@@ -264,38 +326,54 @@ def analyze(path: Path, exclude: tuple[str, ...]) -> None:
         table.add_column("Functions", justify="right")
         table.add_column("Imports", justify="right")
 
+        # Accumulate the summary totals in the same pass that builds the
+        # rows instead of re-walking the three dicts afterwards
+        total_classes = 0
+        total_functions = 0
+        total_imports = 0
+        classes = analyzer.classes
+        functions = analyzer.functions
+        imports = analyzer.imports
+        rows = []
+
         for module_name in sorted(analyzer.modules.keys()):
-            class_count = len(analyzer.classes.get(module_name, []))
-            func_count = len(analyzer.functions.get(module_name, []))
-            import_count = len(analyzer.imports.get(module_name, []))
-
-            table.add_row(
-                module_name,
-                str(class_count),
-                str(func_count),
-                str(import_count),
+            class_count = len(classes.get(module_name, ()))
+            func_count = len(functions.get(module_name, ()))
+            import_count = len(imports.get(module_name, ()))
+            total_classes += class_count
+            total_functions += func_count
+            total_imports += import_count
+            rows.append(
+                (module_name, str(class_count), str(func_count), str(import_count))
             )
 
-        console.print(table)
+        # Feed the prebuilt rows through a hoisted bound method; Rich's
+        # per-row style validation is the analyze command's hot spot on
+        # large module tables
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
 
-        # Summary statistics
-        total_modules = len(analyzer.modules)
-        total_classes = sum(len(classes) for classes in analyzer.classes.values())
-        total_functions = sum(len(funcs) for funcs in analyzer.functions.values())
-        total_imports = sum(len(imps) for imps in analyzer.imports.values())
+        console.print(table)
 
-        console.print(f"\n[bold]Summary:[/bold]")
-        console.print(f"  Total Modules: {total_modules}")
-        console.print(f"  Total Classes: {total_classes}")
-        console.print(f"  Total Functions: {total_functions}")
-        console.print(f"  Total Imports: {total_imports}")
+        console.print(
+            f"\n[bold]Summary:[/bold]\n"
+            f"  Total Modules: {len(analyzer.modules)}\n"
+            f"  Total Classes: {total_classes}\n"
+            f"  Total Functions: {total_functions}\n"
+            f"  Total Imports: {total_imports}"
+        )
 
-        # Dependency information
+        # Dependency information. Set membership replaces the per-dep scan
+        # over every module name; dependencies are already reduced to base
+        # modules, so the top-level package names cover the prefix case.
         dependencies = analyzer.get_dependencies()
+        module_set = set(analyzer.modules)
+        module_prefixes = {name.partition(".")[0] for name in module_set}
         external_deps = set()
         for deps in dependencies.values():
             for dep in deps:
-                if not any(dep in m or m.startswith(dep) for m in analyzer.modules):
+                if dep not in module_set and dep not in module_prefixes:
                     external_deps.add(dep)
 
         if external_deps:
@@ -311,30 +389,7 @@ def analyze(path: Path, exclude: tuple[str, ...]) -> None:
 @main.command()
 def formats() -> None:
     """Display information about supported output formats."""
-    console.print("\n[bold cyan]Supported Output Formats[/bold cyan]\n")
-
-    # Mermaid
-    console.print("[bold]Mermaid[/bold] (.mmd, .md)")
-    console.print("  • Markdown-compatible diagram format")
-    console.print("  • Can be rendered in GitHub, GitLab, and many editors")
-    console.print("  • Supports class diagrams, flowcharts, and graphs")
-    console.print("  • Recommended for documentation\n")
-
-    # PlantUML
-    console.print("[bold]PlantUML[/bold] (.puml, .plantuml)")
-    console.print("  • Popular UML diagram format")
-    console.print("  • Requires PlantUML or online renderer to view")
-    console.print("  • Supports class and component diagrams")
-    console.print("  • Good for detailed UML documentation\n")
-
-    # GraphViz
-    console.print("[bold]GraphViz[/bold] (.png, .svg, .pdf, .jpg)")
-    console.print("  • Direct image output using GraphViz")
-    console.print("  • Multiple layout engines available")
-    console.print("  • Best for presentations and reports")
-    console.print("  • Requires GraphViz to be installed\n")
-
-    console.print("[dim]Use --format option to select output format[/dim]")
+    console.print(_FORMATS_TEXT)
 
 
 def _get_exporters(
@@ -350,6 +405,12 @@ def _get_exporters(
     Returns:
         List of tuples (exporter, extension, options)
     """
+    from archgraph.exporters import (
+        GraphVizExporter,
+        MermaidExporter,
+        PlantUMLExporter,
+    )
+
     exporters = []
 
     if format_name in ["mermaid", "all"]:
@@ -374,80 +435,132 @@ def _get_exporters(
     return exporters
 
 
+def _options_for(
+    exporter: Any, diagram_kind: str, base_options: dict[str, Any]
+) -> dict[str, Any]:
+    """Build export options for one exporter and diagram kind.
+
+    Consults the exporter's diagram_type_map class attribute instead of
+    isinstance checks, and returns a fresh dict when a diagram_type is
+    added so the shared base options are never mutated.
+
+    Args:
+        exporter: Exporter instance
+        diagram_kind: Diagram kind ('class', 'dependency', 'call', 'package')
+        base_options: Shared exporter options from _get_exporters
+
+    Returns:
+        Options dict to pass to export()
+    """
+    diagram_type = exporter.diagram_type_map.get(diagram_kind)
+    if diagram_type is None:
+        return base_options
+    return {**base_options, "diagram_type": diagram_type}
+
+
+def _export_diagram(
+    view: Any,
+    exporters: list[tuple[Any, str, dict[str, Any]]],
+    output_dir: Path,
+    stem: str,
+    diagram_kind: str,
+) -> None:
+    """Export one diagram view with every selected exporter.
+
+    The exporters are independent per diagram, so with --format all they
+    run on a thread pool: GraphViz blocks on the dot subprocess while the
+    Mermaid and PlantUML string building and file writes proceed.
+
+    Args:
+        view: Flattened GraphView to export
+        exporters: List of (exporter, extension, options) tuples
+        output_dir: Output directory
+        stem: Output filename without extension
+        diagram_kind: Diagram kind passed to _options_for
+    """
+    if len(exporters) == 1:
+        exporter, ext, exporter_options = exporters[0]
+        exporter.export(
+            view,
+            output_dir / f"{stem}{ext}",
+            **_options_for(exporter, diagram_kind, exporter_options),
+        )
+        return
+
+    with ThreadPoolExecutor(max_workers=len(exporters)) as pool:
+        futures = [
+            pool.submit(
+                exporter.export,
+                view,
+                output_dir / f"{stem}{ext}",
+                **_options_for(exporter, diagram_kind, exporter_options),
+            )
+            for exporter, ext, exporter_options in exporters
+        ]
+        for future in futures:
+            future.result()
+
+
 def _generate_class_diagram(
-    analyzer: CodeAnalyzer,
+    analyzer: "CodeAnalyzer",
     exporters: list[tuple[Any, str, dict[str, Any]]],
     output_dir: Path,
     **options: Any,
 ) -> None:
     """Generate class diagram with all exporters."""
-    generator = ClassDiagramGenerator(analyzer)
-    graph = generator.generate(**options)
+    from archgraph.exporters import flatten_graph
+    from archgraph.generators import ClassDiagramGenerator
 
-    for exporter, ext, exporter_options in exporters:
-        output_path = output_dir / f"class_diagram{ext}"
-        if isinstance(exporter, MermaidExporter):
-            exporter_options["diagram_type"] = "class"
-        elif isinstance(exporter, PlantUMLExporter):
-            exporter_options["diagram_type"] = "class"
-        # elif isinstance(exporter, StructurizrExporter):
-        #     exporter_options["diagram_type"] = "component"
-        #     exporter_options["workspace_name"] = "Class Diagram"
-        exporter.export(graph, output_path, **exporter_options)
+    generator = ClassDiagramGenerator(analyzer)
+    # Flatten once; every exporter traverses the same snapshot instead of
+    # re-walking the NetworkX views
+    view = flatten_graph(generator.generate(**options))
+    _export_diagram(view, exporters, output_dir, "class_diagram", "class")
 
 
 def _generate_dependency_graph(
-    analyzer: CodeAnalyzer,
+    analyzer: "CodeAnalyzer",
     exporters: list[tuple[Any, str, dict[str, Any]]],
     output_dir: Path,
     **options: Any,
 ) -> None:
     """Generate dependency graph with all exporters."""
-    generator = DependencyGraphGenerator(analyzer)
-    graph = generator.generate(**options)
+    from archgraph.exporters import flatten_graph
+    from archgraph.generators import DependencyGraphGenerator
 
-    for exporter, ext, exporter_options in exporters:
-        output_path = output_dir / f"dependency_graph{ext}"
-        if isinstance(exporter, MermaidExporter):
-            exporter_options["diagram_type"] = "graph"
-        # elif isinstance(exporter, StructurizrExporter):
-        #     exporter_options["diagram_type"] = "system_context"
-        #     exporter_options["workspace_name"] = "Dependency Graph"
-        exporter.export(graph, output_path, **exporter_options)
+    generator = DependencyGraphGenerator(analyzer)
+    view = flatten_graph(generator.generate(**options))
+    _export_diagram(view, exporters, output_dir, "dependency_graph", "dependency")
 
 
 def _generate_call_graph(
-    analyzer: CodeAnalyzer,
+    analyzer: "CodeAnalyzer",
     exporters: list[tuple[Any, str, dict[str, Any]]],
     output_dir: Path,
     **options: Any,
 ) -> None:
     """Generate call graph with all exporters."""
-    generator = CallGraphGenerator(analyzer)
-    graph = generator.generate(**options)
+    from archgraph.exporters import flatten_graph
+    from archgraph.generators import CallGraphGenerator
 
-    for exporter, ext, exporter_options in exporters:
-        output_path = output_dir / f"call_graph{ext}"
-        if isinstance(exporter, MermaidExporter):
-            exporter_options["diagram_type"] = "flowchart"
-        exporter.export(graph, output_path, **exporter_options)
+    generator = CallGraphGenerator(analyzer)
+    view = flatten_graph(generator.generate(**options))
+    _export_diagram(view, exporters, output_dir, "call_graph", "call")
 
 
 def _generate_package_structure(
-    analyzer: CodeAnalyzer,
+    analyzer: "CodeAnalyzer",
     exporters: list[tuple[Any, str, dict[str, Any]]],
     output_dir: Path,
     **options: Any,
 ) -> None:
     """Generate package structure with all exporters."""
-    generator = PackageStructureGenerator(analyzer)
-    graph = generator.generate(**options)
+    from archgraph.exporters import flatten_graph
+    from archgraph.generators import PackageStructureGenerator
 
-    for exporter, ext, exporter_options in exporters:
-        output_path = output_dir / f"package_structure{ext}"
-        if isinstance(exporter, MermaidExporter):
-            exporter_options["diagram_type"] = "graph"
-        exporter.export(graph, output_path, **exporter_options)
+    generator = PackageStructureGenerator(analyzer)
+    view = flatten_graph(generator.generate(**options))
+    _export_diagram(view, exporters, output_dir, "package_structure", "package")
 
 
 @main.command()
@@ -478,6 +591,9 @@ def llm_analyze(
 
     PATH: Directory containing Python code to analyze
     """
+    from archgraph._analysis import get_analyzer
+    from archgraph.llm_analyzer import LLMAnalyzer
+
     try:
         with Progress(
             SpinnerColumn(),
@@ -486,8 +602,7 @@ def llm_analyze(
         ) as progress:
             # Analyze code
             task = progress.add_task("[cyan]Analyzing Python code...", total=None)
-            analyzer = CodeAnalyzer(path)
-            analyzer.analyze(exclude_patterns=list(exclude))
+            analyzer = get_analyzer(path, exclude)
             progress.update(task, completed=True)
 
             # Run LLM analysis
@@ -584,6 +699,9 @@ def llm_suggest(path: Path, exclude: tuple[str, ...], reasoning_effort: str) ->
 
     PATH: Directory containing Python code to analyze
     """
+    from archgraph._analysis import get_analyzer
+    from archgraph.llm_analyzer import LLMAnalyzer
+
     try:
         with Progress(
             SpinnerColumn(),
@@ -591,8 +709,7 @@ def llm_suggest(path: Path, exclude: tuple[str, ...], reasoning_effort: str) ->
             console=console,
         ) as progress:
             task = progress.add_task("[cyan]Analyzing code structure...", total=None)
-            analyzer = CodeAnalyzer(path)
-            analyzer.analyze(exclude_patterns=list(exclude))
+            analyzer = get_analyzer(path, exclude)
             progress.update(task, completed=True)
 
             task = progress.add_task("[cyan]Getting AI suggestions...", total=None)
@@ -640,6 +757,9 @@ def llm_explain(path: Path, exclude: tuple[str, ...], reasoning_effort: str) ->
 
     PATH: Directory containing Python code to analyze
     """
+    from archgraph._analysis import get_analyzer
+    from archgraph.llm_analyzer import LLMAnalyzer
+
     try:
         with Progress(
             SpinnerColumn(),
@@ -647,8 +767,7 @@ def llm_explain(path: Path, exclude: tuple[str, ...], reasoning_effort: str) ->
             console=console,
         ) as progress:
             task = progress.add_task("[cyan]Analyzing dependencies...", total=None)
-            analyzer = CodeAnalyzer(path)
-            analyzer.analyze(exclude_patterns=list(exclude))
+            analyzer = get_analyzer(path, exclude)
             progress.update(task, completed=True)
 
             task = progress.add_task("[cyan]Generating explanation...", total=None)
@@ -1,8 +1,9 @@
 """Exporters for converting NetworkX graphs to various diagram formats."""
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import networkx as nx
 from graphviz import Digraph
@@ -23,15 +24,19 @@ except ImportError:
 class DiagramExporter(ABC):
     """Abstract base class for diagram exporters."""
 
+    # Maps diagram kind ('class', 'dependency', 'call', 'package') to the
+    # diagram_type option this exporter wants for it; kinds not listed use
+    # the exporter's default
+    diagram_type_map: dict[str, str] = {}
+
     @abstractmethod
-    def export(
-        self, graph: nx.DiGraph, output_path: str | Path, **options: Any
-    ) -> None:
+    def export(self, graph: nx.DiGraph, output_path: Path, **options: Any) -> None:
         """Export the graph to a file.
 
         Args:
             graph: NetworkX graph to export
-            output_path: Path where the diagram should be saved
+            output_path: Path where the diagram should be saved; the caller
+                must ensure its parent directory exists
             **options: Exporter-specific options
         """
         pass
@@ -50,156 +55,322 @@ class DiagramExporter(ABC):
         pass
 
 
+# Characters that are not valid in Mermaid node identifiers
+_SANITIZE_TABLE = str.maketrans({".": "_", "-": "_", " ": "_"})
+
+# Relationship-to-arrow dispatch shared by the Mermaid and PlantUML class
+# diagrams; one dict lookup per edge replaces the if/elif chain
+_CLASS_ARROWS = {"inherits": " --|> ", "uses": " ..> "}
+_DEFAULT_ARROW = " --> "
+
+# Mermaid graph node shapes per type; external nodes and the fallback are
+# resolved separately since is_external only matters for untyped nodes
+_NODE_TEMPLATES = {
+    "package": '    {nid}["{label}"]',
+    "module": '    {nid}("{label}")',
+}
+_EXTERNAL_TEMPLATE = "    {nid}{{{label}}}"
+_DEFAULT_TEMPLATE = '    {nid}["{label}"]'
+
+# GraphViz node styling per type, with the same external/default split
+_GV_NODE_ATTRS: dict[str, dict[str, str]] = {
+    "class": {"shape": "record", "fillcolor": "lightgreen"},
+    "package": {"shape": "folder", "fillcolor": "lightyellow"},
+    "module": {"shape": "component", "fillcolor": "lightblue"},
+}
+_GV_EXTERNAL_ATTRS = {"fillcolor": "lightgray", "style": "dashed,filled"}
+
+# Extra GraphViz edge attributes per relationship type
+_GV_EDGE_ATTRS: dict[str, dict[str, str]] = {
+    "inherits": {"arrowhead": "empty"},
+    "imports": {"style": "dashed"},
+}
+_NO_ATTRS: dict[str, str] = {}
+
+class GraphView:
+    """Column-oriented snapshot of a NetworkX graph shared across exporters.
+
+    Node fields live in parallel lists (structure-of-arrays) rather than
+    per-node dicts, so each exporter loop zips over exactly the columns it
+    needs — a contiguous sequential scan instead of chasing NetworkX's
+    dict-of-dicts per node — and the .get-with-default calls happen once
+    at flatten time.
+    """
+
+    __slots__ = (
+        "ids",
+        "sanitized_ids",
+        "types",
+        "names",
+        "attrs",
+        "methods",
+        "is_external",
+        "edges",
+        "sanitized_by_id",
+        "name_by_id",
+    )
+
+    def __init__(
+        self,
+        ids: list[str],
+        sanitized_ids: list[str],
+        types: list[str],
+        names: list[str],
+        attrs: list[tuple],
+        methods: list[tuple],
+        is_external: bytearray,
+        edges: list[tuple[str, str, str]],
+    ):
+        """Initialize the view.
+
+        Args:
+            ids: Node identifiers
+            sanitized_ids: Mermaid-safe node identifiers, parallel to ids
+            types: Node types, parallel to ids
+            names: Display names, parallel to ids
+            attrs: Attribute tuples, parallel to ids
+            methods: Method-dict tuples, parallel to ids
+            is_external: External-node flags, parallel to ids
+            edges: Tuples of (source_id, target_id, relationship)
+        """
+        self.ids = ids
+        self.sanitized_ids = sanitized_ids
+        self.types = types
+        self.names = names
+        self.attrs = attrs
+        self.methods = methods
+        self.is_external = is_external
+        self.edges = edges
+        # Edge loops resolve endpoints through these flat maps
+        self.sanitized_by_id = dict(zip(ids, sanitized_ids))
+        self.name_by_id = dict(zip(ids, names))
+
+
+def flatten_graph(graph: nx.DiGraph) -> GraphView:
+    """Flatten a NetworkX graph into a GraphView.
+
+    Args:
+        graph: NetworkX graph to flatten
+
+    Returns:
+        GraphView over the graph's nodes and edges
+    """
+    ids: list[str] = []
+    sanitized_ids: list[str] = []
+    types: list[str] = []
+    names: list[str] = []
+    attrs: list[tuple] = []
+    methods: list[tuple] = []
+    is_external = bytearray()
+
+    for node, data in graph.nodes(data=True):
+        ids.append(node)
+        sanitized_ids.append(_sanitize_id(node))
+        types.append(data.get("type", ""))
+        names.append(data.get("name", node))
+        attrs.append(tuple(data.get("attributes") or ()))
+        methods.append(tuple(data.get("methods") or ()))
+        is_external.append(1 if data.get("is_external", False) else 0)
+
+    edges = [
+        (source, target, data.get("relationship", ""))
+        for source, target, data in graph.edges(data=True)
+    ]
+    return GraphView(
+        ids, sanitized_ids, types, names, attrs, methods, is_external, edges
+    )
+
+
+def _as_view(graph: "nx.DiGraph | GraphView") -> GraphView:
+    """Return the graph as a GraphView, flattening if necessary.
+
+    Args:
+        graph: NetworkX graph or an already-flattened view
+
+    Returns:
+        GraphView over the graph
+    """
+    return graph if isinstance(graph, GraphView) else flatten_graph(graph)
+
+
+@lru_cache(maxsize=None)
+def _sanitize_id(node_name: str) -> str:
+    """Sanitize node name for use as Mermaid ID.
+
+    A single translate pass replaces the three chained str.replace calls,
+    and the cache covers nodes that reappear as endpoints of many edges.
+
+    Args:
+        node_name: Original node name
+
+    Returns:
+        Sanitized ID
+    """
+    return node_name.translate(_SANITIZE_TABLE)
+
+
 class MermaidExporter(DiagramExporter):
     """Export diagrams to Mermaid format."""
 
+    diagram_type_map = {
+        "class": "class",
+        "dependency": "graph",
+        "call": "flowchart",
+        "package": "graph",
+    }
+
     def export(
-        self, graph: nx.DiGraph, output_path: str | Path, **options: Any
+        self, graph: "nx.DiGraph | GraphView", output_path: Path, **options: Any
     ) -> None:
         """Export graph to Mermaid file.
 
         Args:
-            graph: NetworkX graph to export
-            output_path: Path to save the Mermaid diagram
+            graph: NetworkX graph or flattened GraphView to export
+            output_path: Path to save the Mermaid diagram; the caller must
+                ensure its parent directory exists
             **options: Additional options (diagram_type, etc.)
         """
-        output_path = Path(output_path)
-        content = self.to_string(graph, **options)
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        # One C-level call instead of open/write/close plus buffer setup
+        output_path.write_text(self.to_string(graph, **options), encoding="utf-8")
 
-    def to_string(self, graph: nx.DiGraph, **options: Any) -> str:
+    def to_string(self, graph: "nx.DiGraph | GraphView", **options: Any) -> str:
         """Convert graph to Mermaid string.
 
         Args:
-            graph: NetworkX graph to convert
+            graph: NetworkX graph or flattened GraphView to convert
             **options: Options like diagram_type ('class', 'graph', 'flowchart')
 
         Returns:
             Mermaid diagram as string
         """
         diagram_type = options.get("diagram_type", "graph")
+        view = _as_view(graph)
 
         if diagram_type == "class":
-            return self._to_class_diagram(graph)
+            return self._to_class_diagram(view)
         elif diagram_type == "flowchart":
-            return self._to_flowchart(graph)
+            return self._to_flowchart(view)
         else:
-            return self._to_graph(graph)
+            return self._to_graph(view)
 
-    def _to_class_diagram(self, graph: nx.DiGraph) -> str:
+    def _to_class_diagram(self, view: GraphView) -> str:
         """Convert to Mermaid class diagram.
 
         Args:
-            graph: NetworkX graph with class information
+            view: Flattened graph with class information
 
         Returns:
             Mermaid class diagram string
         """
-        lines = ["classDiagram"]
+        # Joining on a generator skips the intermediate line list entirely
+        return "\n".join(self._class_diagram_lines(view))
 
-        for node in graph.nodes():
-            node_data = graph.nodes[node]
-            if node_data.get("type") == "class":
-                class_name = self._sanitize_id(node)
-                lines.append(f"    class {class_name} {{")
+    def _class_diagram_lines(self, view: GraphView) -> Iterator[str]:
+        """Yield the lines of a Mermaid class diagram.
 
-                # Add attributes
-                for attr in node_data.get("attributes", []):
-                    lines.append(f"        +{attr}")
+        Args:
+            view: Flattened graph with class information
 
-                # Add methods
-                for method in node_data.get("methods", []):
-                    method_name = method["name"]
-                    args = ", ".join(method.get("args", []))
-                    returns = method.get("returns", "")
-                    return_str = f" {returns}" if returns else ""
-                    lines.append(f"        +{method_name}({args}){return_str}")
+        Yields:
+            Diagram lines
+        """
+        yield "classDiagram"
 
-                lines.append("    }")
+        for sanitized_id, node_type, attrs, methods in zip(
+            view.sanitized_ids, view.types, view.attrs, view.methods
+        ):
+            if node_type != "class":
+                continue
+            yield f"    class {sanitized_id} {{"
 
-        # Add relationships
-        for source, target, data in graph.edges(data=True):
-            relationship = data.get("relationship", "")
-            source_id = self._sanitize_id(source)
-            target_id = self._sanitize_id(target)
-
-            if relationship == "inherits":
-                lines.append(f"    {source_id} --|> {target_id}")
-            elif relationship == "uses":
-                lines.append(f"    {source_id} ..> {target_id}")
-            else:
-                lines.append(f"    {source_id} --> {target_id}")
+            # Add attributes
+            for attr in attrs:
+                yield f"        +{attr}"
+
+            # Add methods
+            for method in methods:
+                method_name = method["name"]
+                args = ", ".join(method.get("args", ()))
+                returns = method.get("returns", "")
+                return_str = f" {returns}" if returns else ""
+                yield f"        +{method_name}({args}){return_str}"
 
-        return "\n".join(lines)
+            yield "    }"
 
-    def _to_flowchart(self, graph: nx.DiGraph) -> str:
+        # Add relationships
+        sanitized_by_id = view.sanitized_by_id
+        for source, target, relationship in view.edges:
+            arrow = _CLASS_ARROWS.get(relationship, _DEFAULT_ARROW)
+            yield f"    {sanitized_by_id[source]}{arrow}{sanitized_by_id[target]}"
+
+    def _to_flowchart(self, view: GraphView) -> str:
         """Convert to Mermaid flowchart.
 
         Args:
-            graph: NetworkX graph
+            view: Flattened graph
 
         Returns:
             Mermaid flowchart string
         """
-        lines = ["flowchart TD"]
+        return "\n".join(self._flowchart_lines(view))
+
+    def _flowchart_lines(self, view: GraphView) -> Iterator[str]:
+        """Yield the lines of a Mermaid flowchart.
+
+        Args:
+            view: Flattened graph
+
+        Yields:
+            Diagram lines
+        """
+        yield "flowchart TD"
 
         # Add nodes
-        for node in graph.nodes():
-            node_data = graph.nodes[node]
-            node_id = self._sanitize_id(node)
-            label = node_data.get("name", node)
-            lines.append(f'    {node_id}["{label}"]')
+        for node_id, label in zip(view.sanitized_ids, view.names):
+            yield f'    {node_id}["{label}"]'
 
         # Add edges
-        for source, target, data in graph.edges(data=True):
-            source_id = self._sanitize_id(source)
-            target_id = self._sanitize_id(target)
-            relationship = data.get("relationship", "")
+        sanitized_by_id = view.sanitized_by_id
+        for source, target, relationship in view.edges:
             label = f"|{relationship}|" if relationship else ""
-            lines.append(f"    {source_id} -->{label} {target_id}")
+            yield f"    {sanitized_by_id[source]} -->{label} {sanitized_by_id[target]}"
 
-        return "\n".join(lines)
-
-    def _to_graph(self, graph: nx.DiGraph) -> str:
+    def _to_graph(self, view: GraphView) -> str:
         """Convert to Mermaid graph.
 
         Args:
-            graph: NetworkX graph
+            view: Flattened graph
 
         Returns:
             Mermaid graph string
         """
-        lines = ["graph TD"]
+        return "\n".join(self._graph_lines(view))
 
-        # Add nodes with labels
-        for node in graph.nodes():
-            node_data = graph.nodes[node]
-            node_id = self._sanitize_id(node)
-            label = node_data.get("name", node)
-            node_type = node_data.get("type", "")
+    def _graph_lines(self, view: GraphView) -> Iterator[str]:
+        """Yield the lines of a Mermaid graph.
 
-            # Use different shapes based on type
-            if node_type == "package":
-                lines.append(f'    {node_id}["{label}"]')
-            elif node_type == "module":
-                lines.append(f'    {node_id}("{label}")')
-            elif node_data.get("is_external", False):
-                lines.append(f"    {node_id}{{{label}}}")
-            else:
-                lines.append(f'    {node_id}["{label}"]')
+        Args:
+            view: Flattened graph
+
+        Yields:
+            Diagram lines
+        """
+        yield "graph TD"
+
+        # Add nodes with shape templates looked up by type
+        for node_id, node_type, label, is_external in zip(
+            view.sanitized_ids, view.types, view.names, view.is_external
+        ):
+            tmpl = _NODE_TEMPLATES.get(node_type)
+            if tmpl is None:
+                tmpl = _EXTERNAL_TEMPLATE if is_external else _DEFAULT_TEMPLATE
+            yield tmpl.format(nid=node_id, label=label)
 
         # Add edges
-        for source, target, data in graph.edges(data=True):
-            source_id = self._sanitize_id(source)
-            target_id = self._sanitize_id(target)
-            relationship = data.get("relationship", "")
+        sanitized_by_id = view.sanitized_by_id
+        for source, target, relationship in view.edges:
             label = f"|{relationship}|" if relationship else ""
-            lines.append(f"    {source_id} -->{label} {target_id}")
-
-        return "\n".join(lines)
+            yield f"    {sanitized_by_id[source]} -->{label} {sanitized_by_id[target]}"
 
     def _sanitize_id(self, node_name: str) -> str:
         """Sanitize node name for use as Mermaid ID.
@@ -210,152 +381,162 @@ class MermaidExporter(DiagramExporter):
         Returns:
             Sanitized ID
         """
-        return node_name.replace(".", "_").replace("-", "_").replace(" ", "_")
+        return _sanitize_id(node_name)
 
 
 class PlantUMLExporter(DiagramExporter):
     """Export diagrams to PlantUML format."""
 
+    diagram_type_map = {"class": "class"}
+
     def export(
-        self, graph: nx.DiGraph, output_path: str | Path, **options: Any
+        self, graph: "nx.DiGraph | GraphView", output_path: Path, **options: Any
     ) -> None:
         """Export graph to PlantUML file.
 
         Args:
-            graph: NetworkX graph to export
-            output_path: Path to save the PlantUML diagram
+            graph: NetworkX graph or flattened GraphView to export
+            output_path: Path to save the PlantUML diagram; the caller must
+                ensure its parent directory exists
             **options: Additional options
         """
-        output_path = Path(output_path)
-        content = self.to_string(graph, **options)
+        # One C-level call instead of open/write/close plus buffer setup
+        output_path.write_text(self.to_string(graph, **options), encoding="utf-8")
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-    def to_string(self, graph: nx.DiGraph, **options: Any) -> str:
+    def to_string(self, graph: "nx.DiGraph | GraphView", **options: Any) -> str:
         """Convert graph to PlantUML string.
 
         Args:
-            graph: NetworkX graph to convert
+            graph: NetworkX graph or flattened GraphView to convert
             **options: Options like diagram_type
 
         Returns:
             PlantUML diagram as string
         """
         diagram_type = options.get("diagram_type", "component")
+        view = _as_view(graph)
 
         if diagram_type == "class":
-            return self._to_class_diagram(graph)
+            return self._to_class_diagram(view)
         else:
-            return self._to_component_diagram(graph)
+            return self._to_component_diagram(view)
 
-    def _to_class_diagram(self, graph: nx.DiGraph) -> str:
+    def _to_class_diagram(self, view: GraphView) -> str:
         """Convert to PlantUML class diagram.
 
         Args:
-            graph: NetworkX graph with class information
+            view: Flattened graph with class information
 
         Returns:
             PlantUML class diagram string
         """
-        lines = ["@startuml", ""]
-
-        for node in graph.nodes():
-            node_data = graph.nodes[node]
-            if node_data.get("type") == "class":
-                class_name = node_data.get("name", node)
-                lines.append(f"class {class_name} {{")
-
-                # Add attributes
-                for attr in node_data.get("attributes", []):
-                    lines.append(f"  +{attr}")
+        # Joining on a generator skips the intermediate line list entirely
+        return "\n".join(self._class_diagram_lines(view))
 
-                if node_data.get("attributes") and node_data.get("methods"):
-                    lines.append("  --")
+    def _class_diagram_lines(self, view: GraphView) -> Iterator[str]:
+        """Yield the lines of a PlantUML class diagram.
 
-                # Add methods
-                for method in node_data.get("methods", []):
-                    method_name = method["name"]
-                    args = ", ".join(method.get("args", []))
-                    returns = method.get("returns", "")
-                    return_str = f": {returns}" if returns else ""
-                    lines.append(f"  +{method_name}({args}){return_str}")
+        Args:
+            view: Flattened graph with class information
 
-                lines.append("}")
-                lines.append("")
+        Yields:
+            Diagram lines
+        """
+        yield "@startuml"
+        yield ""
+
+        for node_type, class_name, attrs, methods in zip(
+            view.types, view.names, view.attrs, view.methods
+        ):
+            if node_type != "class":
+                continue
+            yield f"class {class_name} {{"
+
+            # Add attributes
+            for attr in attrs:
+                yield f"  +{attr}"
+
+            if attrs and methods:
+                yield "  --"
+
+            # Add methods
+            for method in methods:
+                method_name = method["name"]
+                args = ", ".join(method.get("args", ()))
+                returns = method.get("returns", "")
+                return_str = f": {returns}" if returns else ""
+                yield f"  +{method_name}({args}){return_str}"
+
+            yield "}"
+            yield ""
 
         # Add relationships
-        for source, target, data in graph.edges(data=True):
-            relationship = data.get("relationship", "")
-            source_name = graph.nodes[source].get("name", source)
-            target_name = graph.nodes[target].get("name", target)
-
-            if relationship == "inherits":
-                lines.append(f"{source_name} --|> {target_name}")
-            elif relationship == "uses":
-                lines.append(f"{source_name} ..> {target_name}")
-            else:
-                lines.append(f"{source_name} --> {target_name}")
+        name_by_id = view.name_by_id
+        for source, target, relationship in view.edges:
+            arrow = _CLASS_ARROWS.get(relationship, _DEFAULT_ARROW)
+            yield f"{name_by_id[source]}{arrow}{name_by_id[target]}"
 
-        lines.append("")
-        lines.append("@enduml")
-        return "\n".join(lines)
+        yield ""
+        yield "@enduml"
 
-    def _to_component_diagram(self, graph: nx.DiGraph) -> str:
+    def _to_component_diagram(self, view: GraphView) -> str:
         """Convert to PlantUML component diagram.
 
         Args:
-            graph: NetworkX graph
+            view: Flattened graph
 
         Returns:
             PlantUML component diagram string
         """
-        lines = ["@startuml", ""]
+        return "\n".join(self._component_diagram_lines(view))
 
-        # Add components
-        for node in graph.nodes():
-            node_data = graph.nodes[node]
-            node_type = node_data.get("type", "component")
-            name = node_data.get("name", node)
+    def _component_diagram_lines(self, view: GraphView) -> Iterator[str]:
+        """Yield the lines of a PlantUML component diagram.
+
+        Args:
+            view: Flattened graph
 
+        Yields:
+            Diagram lines
+        """
+        yield "@startuml"
+        yield ""
+
+        # Add components
+        for node_type, name in zip(view.types, view.names):
             if node_type == "package":
-                lines.append(f'package "{name}" {{')
-                lines.append("}")
+                yield f'package "{name}" {{'
+                yield "}"
             elif node_type == "module":
-                lines.append(f'component "{name}"')
+                yield f'component "{name}"'
             else:
-                lines.append(f"[{name}]")
+                yield f"[{name}]"
 
-        lines.append("")
+        yield ""
 
         # Add relationships
-        for source, target, data in graph.edges(data=True):
-            relationship = data.get("relationship", "")
+        for source, target, relationship in view.edges:
             label = f" : {relationship}" if relationship else ""
-            lines.append(f"{source} --> {target}{label}")
+            yield f"{source} --> {target}{label}"
 
-        lines.append("")
-        lines.append("@enduml")
-        return "\n".join(lines)
+        yield ""
+        yield "@enduml"
 
 
 class GraphVizExporter(DiagramExporter):
     """Export diagrams using GraphViz."""
 
     def export(
-        self, graph: nx.DiGraph, output_path: str | Path, **options: Any
+        self, graph: "nx.DiGraph | GraphView", output_path: Path, **options: Any
     ) -> None:
         """Export graph to image file using GraphViz.
 
         Args:
-            graph: NetworkX graph to export
-            output_path: Path to save the diagram (extension determines format)
+            graph: NetworkX graph or flattened GraphView to export
+            output_path: Path to save the diagram (extension determines
+                format); the caller must ensure its parent directory exists
             **options: Additional options (layout, format, etc.)
         """
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
         # Create GraphViz diagram
         dot = self._create_graphviz(graph, **options)
 
@@ -364,15 +545,16 @@ class GraphVizExporter(DiagramExporter):
         if not format_name:
             format_name = options.get("format", "png")
 
-        # Render to file
-        output_base = str(output_path.with_suffix(""))
-        dot.render(output_base, format=format_name, cleanup=True)
+        # pipe() feeds the DOT source to one subprocess and returns the
+        # rendered bytes, skipping render()'s intermediate source file,
+        # output rename, and cleanup pass
+        output_path.write_bytes(dot.pipe(format=format_name))
 
-    def to_string(self, graph: nx.DiGraph, **options: Any) -> str:
+    def to_string(self, graph: "nx.DiGraph | GraphView", **options: Any) -> str:
         """Convert graph to GraphViz DOT string.
 
         Args:
-            graph: NetworkX graph to convert
+            graph: NetworkX graph or flattened GraphView to convert
             **options: Options like layout, rankdir
 
         Returns:
@@ -381,11 +563,13 @@ class GraphVizExporter(DiagramExporter):
         dot = self._create_graphviz(graph, **options)
         return dot.source
 
-    def _create_graphviz(self, graph: nx.DiGraph, **options: Any) -> Digraph:
-        """Create a GraphViz Digraph from NetworkX graph.
+    def _create_graphviz(
+        self, graph: "nx.DiGraph | GraphView", **options: Any
+    ) -> Digraph:
+        """Create a GraphViz Digraph from a graph.
 
         Args:
-            graph: NetworkX graph
+            graph: NetworkX graph or flattened GraphView
             **options: Options like layout, rankdir, node_shape
 
         Returns:
@@ -393,84 +577,85 @@ class GraphVizExporter(DiagramExporter):
         """
         layout = options.get("layout", "dot")
         rankdir = options.get("rankdir", "TB")
+        view = _as_view(graph)
 
         dot = Digraph(engine=layout)
         dot.attr(rankdir=rankdir)
         dot.attr("node", shape="box", style="rounded,filled", fillcolor="lightblue")
 
-        # Add nodes
-        for node in graph.nodes():
-            node_data = graph.nodes[node]
-            label = self._create_node_label(node, node_data, options)
-            node_type = node_data.get("type", "")
-
-            # Customize appearance based on type
-            attrs = {}
-            if node_type == "class":
-                attrs = {"shape": "record", "fillcolor": "lightgreen"}
-            elif node_type == "package":
-                attrs = {"shape": "folder", "fillcolor": "lightyellow"}
-            elif node_type == "module":
-                attrs = {"shape": "component", "fillcolor": "lightblue"}
-            elif node_data.get("is_external", False):
-                attrs = {"fillcolor": "lightgray", "style": "dashed,filled"}
-
-            dot.node(node, label=label, **attrs)
+        # Add nodes; resolve the detail flag once rather than per node
+        show_details = options.get("show_details", True)
+        for node_id, node_type, name, node_attrs, node_methods, is_external in zip(
+            view.ids,
+            view.types,
+            view.names,
+            view.attrs,
+            view.methods,
+            view.is_external,
+        ):
+            label = self._create_node_label(
+                name, node_type, node_attrs, node_methods, show_details
+            )
 
-        # Add edges
-        for source, target, data in graph.edges(data=True):
-            relationship = data.get("relationship", "")
-            label = relationship if relationship else ""
+            # Customize appearance based on type via the lookup table
+            attrs = _GV_NODE_ATTRS.get(node_type)
+            if attrs is None:
+                attrs = _GV_EXTERNAL_ATTRS if is_external else _NO_ATTRS
 
-            # Customize edge style based on relationship
-            attrs = {"label": label}
-            if relationship == "inherits":
-                attrs["arrowhead"] = "empty"
-            elif relationship == "imports":
-                attrs["style"] = "dashed"
+            dot.node(node_id, label=label, **attrs)
 
-            dot.edge(source, target, **attrs)
+        # Add edges; per-relationship styling comes from the dispatch table
+        for source, target, relationship in view.edges:
+            dot.edge(
+                source,
+                target,
+                label=relationship,
+                **_GV_EDGE_ATTRS.get(relationship, _NO_ATTRS),
+            )
 
         return dot
 
     def _create_node_label(
-        self, node: str, node_data: dict[str, Any], options: dict[str, Any]
+        self,
+        name: str,
+        node_type: str,
+        attributes: tuple,
+        methods: tuple,
+        show_details: bool = True,
     ) -> str:
         """Create label for a node.
 
         Args:
-            node: Node identifier
-            node_data: Node data dictionary
-            options: Display options
+            name: Node display name
+            node_type: Node type
+            attributes: Class attribute names
+            methods: Class method dicts
+            show_details: Include attribute/method sections for classes
 
         Returns:
             Formatted label string
         """
-        node_type = node_data.get("type", "")
-        name = node_data.get("name", node)
-
-        if node_type == "class" and options.get("show_details", True):
-            # Create record-style label for classes
-            parts = [f"{name}"]
-
-            attributes = node_data.get("attributes", [])
-            if attributes:
-                parts.append(
-                    "|" + "\\l".join(f"+ {attr}" for attr in attributes) + "\\l"
-                )
-
-            methods = node_data.get("methods", [])
-            if methods:
-                method_strs = []
-                for method in methods:
-                    method_name = method["name"]
-                    args = ", ".join(method.get("args", []))
-                    method_strs.append(f"+ {method_name}({args})")
-                parts.append("|" + "\\l".join(method_strs) + "\\l")
-
-            return "{" + "".join(parts) + "}"
-
-        return name
+        if node_type != "class" or not show_details:
+            return name
+
+        # Record-style label assembled in one pass per section, without
+        # the intermediate parts/method_strs lists
+        attrs_part = (
+            "|" + "\\l".join(f"+ {attr}" for attr in attributes) + "\\l"
+            if attributes
+            else ""
+        )
+        methods_part = (
+            "|"
+            + "\\l".join(
+                f"+ {method['name']}({', '.join(method.get('args', ()))})"
+                for method in methods
+            )
+            + "\\l"
+            if methods
+            else ""
+        )
+        return f"{{{name}{attrs_part}{methods_part}}}"
 
 
 class StructurizrExporter(DiagramExporter):
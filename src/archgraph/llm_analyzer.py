@@ -1,5 +1,6 @@
 """LLM-powered code analysis using Azure OpenAI."""
 
+import json
 import os
 from pathlib import Path
 from typing import Any
@@ -117,6 +118,124 @@ class LLMAnalyzer:
                 "recommendations": [],
             }
 
+    def analyze_full(
+        self,
+        max_completion_tokens: int = 8000,
+        reasoning_effort: str = "medium",
+    ) -> dict[str, Any]:
+        """Run architecture analysis, diagram suggestions, and dependency
+        explanation in a single LLM call.
+
+        Batching the three prompts into one request avoids paying the prompt
+        tokens and network round-trip three times for the same analyzer data.
+
+        Args:
+            max_completion_tokens: Maximum tokens for response
+            reasoning_effort: Reasoning effort level ("low", "medium", "high")
+
+        Returns:
+            Dictionary with keys:
+            - architecture: dict with summary, patterns, issues, recommendations
+            - diagram_suggestions: suggestion text
+            - dependency_explanation: explanation text
+        """
+
+        structure_info = self._gather_structure_info()
+        dependencies = self.analyzer.get_dependencies()
+
+        prompt = f"""Analyze this Python codebase:
+
+## Structure
+- Total Modules: {structure_info["total_modules"]}
+- Total Classes: {structure_info["total_classes"]}
+- Total Functions: {structure_info["total_functions"]}
+
+## Module Breakdown
+{self._format_module_breakdown()}
+
+## Dependencies
+{self._format_dependencies(dependencies)}
+
+## Package Structure
+{self._format_package_structure()}
+
+Return a single JSON object with exactly these keys:
+- "architecture": object with keys "summary" (string), "patterns", "issues", "recommendations" (each an array of strings)
+- "diagram_suggestions": string advising which diagram types (class, dependency, call graph, package structure) would be most valuable, at what depth, and which modules to focus on
+- "dependency_explanation": string explaining the dependency structure, coupling issues, and modularity suggestions in clear, accessible language
+
+Return only the JSON object, no surrounding prose.
+"""
+
+        try:
+            deployment = os.getenv("AZURE_CHAT_DEPLOYMENT", "gpt-5-mini")
+            response = self.client.chat.completions.create(
+                model=deployment,
+                messages=[
+                    {
+                        "role": "developer",
+                        "content": "Formatting re-enabled. You are an expert software architect analyzing Python codebases. Respond with valid JSON only.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                max_completion_tokens=max_completion_tokens,
+                reasoning_effort=reasoning_effort,
+            )
+
+            message = response.choices[0].message
+            content = message.content
+            if not content and hasattr(message, "reasoning_content"):
+                content = message.reasoning_content
+
+            if not content:
+                return {"error": "Empty response from GPT-5"}
+
+            return self._parse_full_report(content)
+
+        except Exception as e:
+            return {"error": f"LLM analysis failed: {str(e)}"}
+
+    def _parse_full_report(self, content: str) -> dict[str, Any]:
+        """Parse the combined JSON report response.
+
+        Args:
+            content: LLM response content
+
+        Returns:
+            Structured dictionary with architecture, diagram_suggestions,
+            and dependency_explanation keys
+        """
+        text = content.strip()
+
+        # Strip Markdown code fences if the model added them anyway
+        if text.startswith("```"):
+            text = text.split("\n", 1)[-1]
+            if text.endswith("```"):
+                text = text[: -len("```")]
+
+        try:
+            report = json.loads(text)
+        except json.JSONDecodeError:
+            # Fall back to treating the whole response as the architecture
+            # summary so callers still get something useful
+            return {
+                "architecture": self._parse_architecture_response(content),
+                "diagram_suggestions": "",
+                "dependency_explanation": "",
+            }
+
+        architecture = report.get("architecture") or {}
+        return {
+            "architecture": {
+                "summary": architecture.get("summary", ""),
+                "patterns": architecture.get("patterns", []),
+                "issues": architecture.get("issues", []),
+                "recommendations": architecture.get("recommendations", []),
+            },
+            "diagram_suggestions": report.get("diagram_suggestions", ""),
+            "dependency_explanation": report.get("dependency_explanation", ""),
+        }
+
     def analyze_class_design(
         self,
         module_name: str,
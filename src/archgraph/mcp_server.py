@@ -1,25 +1,18 @@
 """MCP server for ArchGraph - expose architecture analysis tools via Model Context Protocol."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
+from archgraph._analysis import get_analyzer, tree_fingerprint
 from archgraph.analyzer import CodeAnalyzer
-from archgraph.exporters import (
-    GraphVizExporter,
-    MermaidExporter,
-    PlantUMLExporter,
-)
-from archgraph.generators import (
-    CallGraphGenerator,
-    ClassDiagramGenerator,
-    DependencyGraphGenerator,
-    PackageStructureGenerator,
-)
-from archgraph.llm_analyzer import LLMAnalyzer
+
+# Exporters, generators, and the LLM analyzer are imported lazily inside the
+# tool bodies so server cold start only pays for fastmcp and the analyzer.
 
 # Load environment variables
 load_dotenv()
@@ -28,6 +21,66 @@ load_dotenv()
 mcp = FastMCP("ArchGraph", dependencies=["archgraph"])
 
 
+def _get_analyzer(
+    project_path: Path, exclude_patterns: list[str] | None
+) -> CodeAnalyzer:
+    """Get a cached analyzer for a project, re-analyzing only when it changed.
+
+    Args:
+        project_path: Resolved project path
+        exclude_patterns: Optional exclude patterns
+
+    Returns:
+        Analyzed CodeAnalyzer instance
+    """
+    return get_analyzer(project_path, tuple(exclude_patterns or ()))
+
+
+# Successful combined AI reports, keyed by (path, excludes, fingerprint,
+# effort). A manual dict instead of lru_cache so error results are never
+# memoized: a transient API failure must not stick until the tree changes.
+_MAX_REPORTS = 8
+_full_reports: dict[tuple[str, tuple[str, ...], str, str], dict[str, Any]] = {}
+
+
+def _get_full_report(
+    project_path: Path,
+    exclude_patterns: list[str] | None,
+    reasoning_effort: str,
+) -> dict[str, Any]:
+    """Get the cached combined AI report for a project.
+
+    Args:
+        project_path: Resolved project path
+        exclude_patterns: Optional exclude patterns
+        reasoning_effort: AI reasoning effort level
+
+    Returns:
+        Full report dictionary
+    """
+    excludes = tuple(exclude_patterns or ())
+    key = (
+        str(project_path),
+        excludes,
+        tree_fingerprint(project_path),
+        reasoning_effort,
+    )
+    report = _full_reports.get(key)
+    if report is None:
+        from archgraph.llm_analyzer import LLMAnalyzer
+
+        analyzer = get_analyzer(project_path, excludes)
+        llm_analyzer = LLMAnalyzer(analyzer)
+        report = llm_analyzer.analyze_full(reasoning_effort=reasoning_effort)
+        if "error" not in report:
+            if len(_full_reports) >= _MAX_REPORTS:
+                _full_reports.pop(next(iter(_full_reports)))
+            _full_reports[key] = report
+    # Hand each caller its own top-level dict so tool-side mutation cannot
+    # corrupt the cached copy
+    return dict(report)
+
+
 @mcp.tool()
 def analyze_codebase(
     path: str,
@@ -47,8 +100,7 @@ def analyze_codebase(
     if not project_path.exists():
         return {"error": f"Path does not exist: {path}"}
 
-    analyzer = CodeAnalyzer(project_path)
-    analyzer.analyze(exclude_patterns=exclude_patterns or [])
+    analyzer = _get_analyzer(project_path, exclude_patterns)
 
     return {
         "total_modules": len(analyzer.modules),
@@ -87,14 +139,15 @@ def generate_class_diagram(
         Dictionary with status and output path
     """
     try:
+        from archgraph.generators import ClassDiagramGenerator
+
         project_path = Path(path).resolve()
 
         if not project_path.exists():
             return {"error": f"Path does not exist: {path}"}
 
-        # Analyze code
-        analyzer = CodeAnalyzer(project_path)
-        analyzer.analyze(exclude_patterns=exclude_patterns or [])
+        # Analyze code (cached across tool calls until the tree changes)
+        analyzer = _get_analyzer(project_path, exclude_patterns)
 
         # Generate diagram
         generator = ClassDiagramGenerator(analyzer)
@@ -107,6 +160,8 @@ def generate_class_diagram(
         # Export
         exporter = _get_exporter(format)
         output_file = Path(output_path)
+        # Exporters expect the parent directory to exist
+        output_file.parent.mkdir(parents=True, exist_ok=True)
 
         if format == "mermaid":
             exporter.export(graph, output_file, diagram_type="class")
@@ -148,14 +203,15 @@ def generate_dependency_graph(
         Dictionary with status and output path
     """
     try:
+        from archgraph.generators import DependencyGraphGenerator
+
         project_path = Path(path).resolve()
 
         if not project_path.exists():
             return {"error": f"Path does not exist: {path}"}
 
-        # Analyze code
-        analyzer = CodeAnalyzer(project_path)
-        analyzer.analyze(exclude_patterns=exclude_patterns or [])
+        # Analyze code (cached across tool calls until the tree changes)
+        analyzer = _get_analyzer(project_path, exclude_patterns)
 
         # Generate diagram
         generator = DependencyGraphGenerator(analyzer)
@@ -167,6 +223,8 @@ def generate_dependency_graph(
         # Export
         exporter = _get_exporter(format)
         output_file = Path(output_path)
+        # Exporters expect the parent directory to exist
+        output_file.parent.mkdir(parents=True, exist_ok=True)
 
         if format == "mermaid":
             exporter.export(graph, output_file, diagram_type="graph")
@@ -205,17 +263,12 @@ def ai_analyze_architecture(
         if not project_path.exists():
             return {"error": f"Path does not exist: {path}"}
 
-        # Analyze code
-        analyzer = CodeAnalyzer(project_path)
-        analyzer.analyze(exclude_patterns=exclude_patterns or [])
-
-        # Run AI analysis
-        llm_analyzer = LLMAnalyzer(analyzer)
-        results = llm_analyzer.analyze_architecture(
-            reasoning_effort=reasoning_effort,
-        )
+        # One batched LLM call serves all three AI tools
+        report = _get_full_report(project_path, exclude_patterns, reasoning_effort)
+        if "error" in report:
+            return report
 
-        return results
+        return report["architecture"]
 
     except ValueError as e:
         return {
@@ -248,17 +301,12 @@ def ai_suggest_diagrams(
         if not project_path.exists():
             return {"error": f"Path does not exist: {path}"}
 
-        # Analyze code
-        analyzer = CodeAnalyzer(project_path)
-        analyzer.analyze(exclude_patterns=exclude_patterns or [])
-
-        # Get AI suggestions
-        llm_analyzer = LLMAnalyzer(analyzer)
-        results = llm_analyzer.suggest_diagram_focus(
-            reasoning_effort=reasoning_effort,
-        )
+        # One batched LLM call serves all three AI tools
+        report = _get_full_report(project_path, exclude_patterns, reasoning_effort)
+        if "error" in report:
+            return report
 
-        return results
+        return {"suggestions": report["diagram_suggestions"]}
 
     except ValueError as e:
         return {
@@ -291,17 +339,12 @@ def ai_explain_dependencies(
         if not project_path.exists():
             return f"Error: Path does not exist: {path}"
 
-        # Analyze code
-        analyzer = CodeAnalyzer(project_path)
-        analyzer.analyze(exclude_patterns=exclude_patterns or [])
+        # One batched LLM call serves all three AI tools
+        report = _get_full_report(project_path, exclude_patterns, reasoning_effort)
+        if "error" in report:
+            return f"Error: {report['error']}"
 
-        # Get AI explanation
-        llm_analyzer = LLMAnalyzer(analyzer)
-        explanation = llm_analyzer.explain_dependency_graph(
-            reasoning_effort=reasoning_effort,
-        )
-
-        return explanation
+        return report["dependency_explanation"]
 
     except ValueError as e:
         return f"Error: {e}\nHint: Set AZURE_OPENAI_API_KEY and AZURE_ENDPOINT in .env file"
@@ -309,6 +352,41 @@ def ai_explain_dependencies(
         return f"Error: {e}"
 
 
+@mcp.tool()
+def ai_full_report(
+    path: str,
+    reasoning_effort: str = "medium",
+    exclude_patterns: list[str] | None = None,
+) -> dict[str, Any]:
+    """Run architecture analysis, diagram suggestions, and dependency
+    explanation in a single LLM call.
+
+    Args:
+        path: Path to the Python project directory
+        reasoning_effort: AI reasoning effort level ("low", "medium", "high")
+        exclude_patterns: Optional list of glob patterns to exclude
+
+    Returns:
+        Dictionary with architecture, diagram_suggestions, and
+        dependency_explanation keys
+    """
+    try:
+        project_path = Path(path).resolve()
+
+        if not project_path.exists():
+            return {"error": f"Path does not exist: {path}"}
+
+        return _get_full_report(project_path, exclude_patterns, reasoning_effort)
+
+    except ValueError as e:
+        return {
+            "error": str(e),
+            "hint": "Set AZURE_OPENAI_API_KEY and AZURE_ENDPOINT in .env file",
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
 @mcp.tool()
 def generate_all_diagrams(
     path: str,
@@ -330,6 +408,13 @@ def generate_all_diagrams(
         Dictionary with status and list of generated diagrams
     """
     try:
+        from archgraph.generators import (
+            CallGraphGenerator,
+            ClassDiagramGenerator,
+            DependencyGraphGenerator,
+            PackageStructureGenerator,
+        )
+
         project_path = Path(path).resolve()
         output_path = Path(output_dir)
 
@@ -338,53 +423,46 @@ def generate_all_diagrams(
 
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Analyze code
-        analyzer = CodeAnalyzer(project_path)
-        analyzer.analyze(exclude_patterns=exclude_patterns or [])
+        # Analyze code (cached across tool calls until the tree changes)
+        analyzer = _get_analyzer(project_path, exclude_patterns)
 
-        generated = []
         exporter = _get_exporter(format)
         ext = _get_extension(format)
 
-        # Class diagram
-        generator = ClassDiagramGenerator(analyzer)
-        graph = generator.generate()
-        output_file = output_path / f"class_diagram{ext}"
-        if format == "mermaid":
-            exporter.export(graph, output_file, diagram_type="class")
-        else:
-            exporter.export(graph, output_file)
-        generated.append(str(output_file))
-
-        # Dependency graph
-        generator = DependencyGraphGenerator(analyzer)
-        graph = generator.generate(include_external=include_external)
-        output_file = output_path / f"dependency_graph{ext}"
-        if format == "mermaid":
-            exporter.export(graph, output_file, diagram_type="graph")
-        else:
-            exporter.export(graph, output_file)
-        generated.append(str(output_file))
-
-        # Call graph
-        generator = CallGraphGenerator(analyzer)
-        graph = generator.generate(include_external=include_external)
-        output_file = output_path / f"call_graph{ext}"
-        if format == "mermaid":
-            exporter.export(graph, output_file, diagram_type="flowchart")
-        else:
-            exporter.export(graph, output_file)
-        generated.append(str(output_file))
-
-        # Package structure
-        generator = PackageStructureGenerator(analyzer)
-        graph = generator.generate()
-        output_file = output_path / f"package_structure{ext}"
-        if format == "mermaid":
-            exporter.export(graph, output_file, diagram_type="graph")
-        else:
-            exporter.export(graph, output_file)
-        generated.append(str(output_file))
+        # The four pipelines share only the read-only analyzer, so they can
+        # run concurrently; graphviz rendering blocks on a subprocess and the
+        # text formats are I/O-bound writes
+        pipelines = [
+            (ClassDiagramGenerator(analyzer), {}, "class_diagram", "class"),
+            (
+                DependencyGraphGenerator(analyzer),
+                {"include_external": include_external},
+                "dependency_graph",
+                "graph",
+            ),
+            (
+                CallGraphGenerator(analyzer),
+                {"include_external": include_external},
+                "call_graph",
+                "flowchart",
+            ),
+            (PackageStructureGenerator(analyzer), {}, "package_structure", "graph"),
+        ]
+
+        def _run_pipeline(
+            pipeline: tuple[Any, dict[str, Any], str, str],
+        ) -> str:
+            generator, options, filename, diagram_type = pipeline
+            graph = generator.generate(**options)
+            output_file = output_path / f"{filename}{ext}"
+            if format == "mermaid":
+                exporter.export(graph, output_file, diagram_type=diagram_type)
+            else:
+                exporter.export(graph, output_file)
+            return str(output_file)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            generated = list(executor.map(_run_pipeline, pipelines))
 
         return {
             "status": "success",
@@ -397,6 +475,17 @@ def generate_all_diagrams(
         return {"error": str(e)}
 
 
+# Exporters are stateless, so shared singletons serve all tool calls;
+# populated on first use to keep graphviz out of the import path
+_EXPORTERS: dict[str, Any] = {}
+
+_EXTENSIONS = {
+    "mermaid": ".mmd",
+    "plantuml": ".puml",
+    "graphviz": ".png",
+}
+
+
 def _get_exporter(format: str) -> Any:
     """Get exporter instance for format.
 
@@ -406,14 +495,19 @@ def _get_exporter(format: str) -> Any:
     Returns:
         Exporter instance
     """
-    if format == "mermaid":
-        return MermaidExporter()
-    elif format == "plantuml":
-        return PlantUMLExporter()
-    elif format == "graphviz":
-        return GraphVizExporter()
-    else:
-        return MermaidExporter()
+    if not _EXPORTERS:
+        from archgraph.exporters import (
+            GraphVizExporter,
+            MermaidExporter,
+            PlantUMLExporter,
+        )
+
+        _EXPORTERS.update(
+            mermaid=MermaidExporter(),
+            plantuml=PlantUMLExporter(),
+            graphviz=GraphVizExporter(),
+        )
+    return _EXPORTERS.get(format, _EXPORTERS["mermaid"])
 
 
 def _get_extension(format: str) -> str:
@@ -425,12 +519,7 @@ def _get_extension(format: str) -> str:
     Returns:
         File extension with dot
     """
-    extensions = {
-        "mermaid": ".mmd",
-        "plantuml": ".puml",
-        "graphviz": ".png",
-    }
-    return extensions.get(format, ".mmd")
+    return _EXTENSIONS.get(format, ".mmd")
 
 
 # Run server
@@ -1,16 +1,22 @@
 """Tests for the code analyzer module."""
 
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
+from archgraph._ast_cache import AstCache
 from archgraph.analyzer import CodeAnalyzer
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def temp_project():
-    """Create a temporary Python project for testing."""
+    """Create a temporary Python project shared by the whole test session.
+
+    Tests must not add, remove, or rewrite files in this tree; tests that
+    need to mutate a project build their own temporary directory.
+    """
     with tempfile.TemporaryDirectory() as tmpdir:
         project_path = Path(tmpdir)
 
@@ -123,19 +129,26 @@ def test_analyze_finds_imports(temp_project):
     assert any("Path" in name for name in import_names)
 
 
-def test_analyze_excludes_patterns(temp_project):
+def test_analyze_excludes_patterns():
     """Test that analyzer respects exclude patterns."""
-    # Create a test file
-    (temp_project / "test_something.py").write_text("""
+    # Uses its own tree so the session-scoped fixture stays pristine
+    with tempfile.TemporaryDirectory() as tmpdir:
+        project_path = Path(tmpdir)
+        (project_path / "kept.py").write_text("""
+def kept_function():
+    pass
+""")
+        (project_path / "test_something.py").write_text("""
 def test_function():
     pass
 """)
 
-    analyzer = CodeAnalyzer(temp_project)
-    analyzer.analyze(exclude_patterns=["test_*"])
+        analyzer = CodeAnalyzer(project_path)
+        analyzer.analyze(exclude_patterns=["test_*"])
 
-    # Test file should not be in modules
-    assert not any("test_something" in name for name in analyzer.modules.keys())
+        # Test file should not be in modules
+        assert not any("test_something" in name for name in analyzer.modules.keys())
+        assert any("kept" in name for name in analyzer.modules.keys())
 
 
 def test_get_class_info(temp_project):
@@ -227,6 +240,47 @@ def test_inheritance_detection(temp_project):
         assert "ClassA" in class_b_info["bases"]
 
 
+def test_ast_cache_reuses_results(temp_project, tmp_path):
+    """Test that unchanged files are served from the on-disk cache."""
+    cache = AstCache(tmp_path / "cache")
+    analyzer = CodeAnalyzer(temp_project, ast_cache=cache)
+    analyzer.analyze()
+
+    # First run parses everything
+    assert cache.hits == 0
+    assert cache.misses == len(analyzer.modules)
+
+    # Second run over the unchanged tree should be all cache hits
+    cache = AstCache(tmp_path / "cache")
+    cached_analyzer = CodeAnalyzer(temp_project, ast_cache=cache)
+    cached_analyzer.analyze()
+
+    assert cache.misses == 0
+    assert cache.hits == len(analyzer.modules)
+    assert cached_analyzer.modules == analyzer.modules
+
+
+def test_ast_cache_survives_touch(temp_project, tmp_path):
+    """Test that a changed mtime with unchanged content still hits the cache."""
+    cache = AstCache(tmp_path / "cache")
+    analyzer = CodeAnalyzer(temp_project, ast_cache=cache)
+    analyzer.analyze()
+
+    # Bump every mtime without changing any bytes
+    for py_file in Path(temp_project).rglob("*.py"):
+        os.utime(py_file)
+
+    cache = AstCache(tmp_path / "cache")
+    cached_analyzer = CodeAnalyzer(temp_project, ast_cache=cache)
+    cached_analyzer.analyze()
+
+    # The content-hash fallback rescues every entry
+    assert cache.misses == 0
+    assert cache.hits == len(analyzer.modules)
+    assert cached_analyzer.modules == analyzer.modules
+    assert cached_analyzer.classes == analyzer.classes
+
+
 def test_empty_directory():
     """Test analyzer on empty directory."""
     with tempfile.TemporaryDirectory() as tmpdir: